@@ -1,340 +1,970 @@
+import csv
+import gzip
+import os
+import re
+import shutil
 import sqlite3
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from functools import partial
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Union, Optional
+from typing import Dict, Iterable, List, Union, Optional
 import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional; read_csv_arrow is only used when available
+    pa = pc = pa_csv = None
+try:
+    import duckdb
+except ImportError:  # Optional; bulk_ingest_with_duckdb falls back to load_from_directory
+    duckdb = None
 from models import ElectionRace, BallotMeasure, PersonCandidate, BallotOptionCandidate, CountyResult
 
+# Years embedded in CSV file names, e.g. house_2024.csv
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Loadable files, plain or as written by main.py --compress
+_CSV_PATTERNS = ('*.csv', '*.csv.gz')
+
 class ElectionDatabase:
     """Handles database operations for election data storage."""
+
+    SQL_RECORD_FETCH = (
+        "INSERT INTO election_fetches (year, fetch_timestamp, success, error_message) "
+        "VALUES (?, ?, ?, ?)"
+    )
+    SQL_RECORD_CSV_EXPORT = (
+        "INSERT OR REPLACE INTO csv_exports (year, export_timestamp, file_type, file_path) "
+        "VALUES (?, ?, ?, ?)"
+    )
+
+    # Rows handed to each executemany() call; keeps memory bounded on wide files
+    INSERT_BATCH_SIZE = 20000
+
+    # Rows bound per multi-row INSERT, capped so rows * columns stays within
+    # SQLite's default limit on bound parameters
+    ROWS_PER_INSERT = 500
+    MAX_BOUND_PARAMETERS = 32766
+
+    # Unique keys of the result tables, kept as separate indexes (pk_<table>)
+    # so bulk reloads can drop and rebuild them instead of updating per row
+    PRIMARY_KEYS = {
+        'ballot_measures': ('race_id', 'candidate_id'),
+        'house_races': ('race_id', 'candidate_id'),
+        'governor_races': ('race_id', 'candidate_id'),
+        'senate_races': ('race_id', 'candidate_id'),
+        'presidential_races': ('race_id', 'candidate_id'),
+        'county_results': ('race_id', 'county_fips', 'candidate_id'),
+    }
+
+    # Columns read by the yearly summary queries, indexed behind the year
+    # prefix so those queries never touch the table itself
+    YEAR_INDEX_COLUMNS = {
+        'ballot_measures': ('race_id', 'state_postal', 'category'),
+        'house_races': ('race_id', 'state_postal', 'party', 'incumbent'),
+        'governor_races': ('race_id', 'state_postal', 'party', 'incumbent'),
+        'senate_races': ('race_id', 'state_postal', 'party', 'incumbent'),
+        'presidential_races': ('race_id', 'state_postal', 'party', 'incumbent'),
+        'county_results': ('race_id', 'county_fips', 'state_postal'),
+    }
+
+    # Files loaded per committed batch in load_from_directory
+    CHECKPOINT_EVERY_FILES = 20
+
+    # Worker processes parsing CSVs for load_from_directory (None: one per CPU)
+    PARSE_WORKERS = None
+
+    # Files with at least this many rows are streamed in with the sqlite3
+    # shell's .import instead of going through pandas
+    FAST_IMPORT_MIN_ROWS = 50000
+
+    # Strings pandas.read_csv treats as missing by default
+    NA_STRINGS = ('', 'NA', 'N/A', 'n/a', '#N/A', 'NULL', 'null', 'NaN', 'nan', 'None', '<NA>')
+
+    # Placeholders for missing county identifiers, shared by all load paths
+    COUNTY_DEFAULTS = {
+        'county_name': 'Unknown',
+        'county_fips': '00000',
+        'county_id': '0',
+    }
     
     def __init__(self, db_path: str = "election_data.db"):
         """Initialize database connection and create tables if they don't exist."""
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Autocommit mode: transactions are opened explicitly via transaction().
+        # A larger statement cache keeps the per-table INSERTs and summary
+        # queries prepared across calls.
+        self.conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
+        # INSERT statements by (table, columns, rows), so files of the same shape
+        # reuse the same SQL string and hit the statement cache
+        self.insert_sql: Dict[tuple, str] = {}
         self.conn.row_factory = sqlite3.Row
+        # Summary queries read through separate read-only connections, which
+        # under WAL don't wait on (or block) an in-progress load
+        self.read_only_uri = None
+        if db_path != ':memory:' and not db_path.startswith('file:'):
+            self.read_only_uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+        self.configure_connection()
         self.create_tables()
+
+    def configure_connection(self):
+        """Apply journaling and cache PRAGMAs tuned for bulk ingest."""
+        # page_size only takes effect on a fresh database (or after VACUUM),
+        # so it has to run before WAL is enabled and tables are created.
+        self.conn.executescript('''
+            PRAGMA page_size=8192;
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-131072;
+            PRAGMA mmap_size=268435456;
+        ''')
+
+    @contextmanager
+    def transaction(self):
+        """Run a block in a single write transaction.
+
+        Nested use (e.g. a file load inside a directory load) becomes a
+        savepoint, so a failing inner block only rolls back its own work.
+        """
+        if self.conn.in_transaction:
+            self.conn.execute("SAVEPOINT nested")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK TO nested")
+                self.conn.execute("RELEASE nested")
+                raise
+            self.conn.execute("RELEASE nested")
+        else:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
     
+    @contextmanager
+    def reader(self):
+        """Borrow a short-lived read-only connection for queries.
+
+        Falls back to the main connection for in-memory databases, and while
+        it has a transaction open so callers still see their own writes.
+        """
+        if self.read_only_uri is None or self.conn.in_transaction:
+            yield self.conn
+            return
+
+        conn = sqlite3.connect(self.read_only_uri, uri=True, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
     def create_tables(self):
         """Create tables that directly match CSV structures."""
-        with self.conn:
-            self.conn.executescript('''
-                -- Track data fetches and exports
-                CREATE TABLE IF NOT EXISTS election_fetches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    year INTEGER NOT NULL,
-                    fetch_timestamp DATETIME NOT NULL,
-                    success BOOLEAN NOT NULL,
-                    error_message TEXT
-                );
-                
-                CREATE TABLE IF NOT EXISTS csv_exports (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    year INTEGER NOT NULL,
-                    export_timestamp DATETIME NOT NULL,
-                    file_type TEXT NOT NULL,
-                    file_path TEXT NOT NULL,
-                    UNIQUE(year, file_type, file_path)
-                );
-
-                -- Ballot measures results
-                CREATE TABLE IF NOT EXISTS ballot_measures (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    state_name TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    category TEXT,
-                    summary TEXT,
-                    race_call_status TEXT NOT NULL,
-                    last_updated DATETIME NOT NULL,
-                    precincts_reporting INTEGER NOT NULL,
-                    precincts_total INTEGER NOT NULL,
-                    precincts_reporting_pct REAL NOT NULL,
-                    expected_vote_pct REAL,
-                    total_votes INTEGER NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    option_name TEXT NOT NULL,
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, candidate_id)
-                );
-
-                -- House races
-                CREATE TABLE IF NOT EXISTS house_races (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    state_name TEXT NOT NULL,
-                    office_id TEXT NOT NULL,
-                    seat_name TEXT,
-                    seat_num TEXT,
-                    race_call_status TEXT NOT NULL,
-                    last_updated DATETIME NOT NULL,
-                    precincts_reporting INTEGER NOT NULL,
-                    precincts_total INTEGER NOT NULL,
-                    precincts_reporting_pct REAL NOT NULL,
-                    expected_vote_pct REAL,
-                    total_votes INTEGER NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    party TEXT NOT NULL,
-                    incumbent BOOLEAN,
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, candidate_id)
-                );
-
-                -- Governor races
-                CREATE TABLE IF NOT EXISTS governor_races (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    state_name TEXT NOT NULL,
-                    race_call_status TEXT NOT NULL,
-                    last_updated DATETIME NOT NULL,
-                    precincts_reporting INTEGER NOT NULL,
-                    precincts_total INTEGER NOT NULL,
-                    precincts_reporting_pct REAL NOT NULL,
-                    expected_vote_pct REAL,
-                    total_votes INTEGER NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    party TEXT NOT NULL,
-                    incumbent BOOLEAN,
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, candidate_id)
-                );
-
-                -- Senate races
-                CREATE TABLE IF NOT EXISTS senate_races (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    state_name TEXT NOT NULL,
-                    office_id TEXT NOT NULL,
-                    seat_name TEXT,
-                    seat_num TEXT,
-                    race_call_status TEXT NOT NULL,
-                    last_updated DATETIME NOT NULL,
-                    precincts_reporting INTEGER NOT NULL,
-                    precincts_total INTEGER NOT NULL,
-                    precincts_reporting_pct REAL NOT NULL,
-                    expected_vote_pct REAL,
-                    total_votes INTEGER NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    party TEXT NOT NULL,
-                    incumbent BOOLEAN,
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, candidate_id)
-                );
-
-                -- Presidential races
-                CREATE TABLE IF NOT EXISTS presidential_races (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    state_name TEXT NOT NULL,
-                    race_call_status TEXT NOT NULL,
-                    last_updated DATETIME NOT NULL,
-                    precincts_reporting INTEGER NOT NULL,
-                    precincts_total INTEGER NOT NULL,
-                    precincts_reporting_pct REAL NOT NULL,
-                    expected_vote_pct REAL,
-                    total_votes INTEGER NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    party TEXT NOT NULL,
-                    incumbent BOOLEAN,
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, candidate_id)
-                );
-
-                -- County-level results for all race types
-                CREATE TABLE IF NOT EXISTS county_results (
-                    race_id TEXT NOT NULL,
-                    state_postal TEXT NOT NULL,
-                    county_name TEXT,               -- Allow NULL
-                    county_fips TEXT,               -- Allow NULL
-                    county_id TEXT,                 -- Allow NULL
-                    precincts_reporting INTEGER,    -- Allow NULL
-                    precincts_total INTEGER,        -- Allow NULL
-                    precincts_reporting_pct REAL,   -- Allow NULL
-                    expected_vote_pct REAL,         -- Allow NULL
-                    total_votes INTEGER,            -- Allow NULL
-                    registered_voters INTEGER,       -- Allow NULL
-                    last_updated DATETIME NOT NULL,
-                    candidate_id TEXT NOT NULL,
-                    first_name TEXT,                -- Allow NULL
-                    last_name TEXT,                 -- Allow NULL
-                    option_name TEXT,               -- Allow NULL
-                    party TEXT,                     -- Allow NULL
-                    vote_count INTEGER NOT NULL,
-                    vote_pct REAL NOT NULL,
-                    PRIMARY KEY (race_id, county_fips, candidate_id)
-                );
-            ''')
+        self.conn.executescript('''
+            -- Track data fetches and exports
+            CREATE TABLE IF NOT EXISTS election_fetches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                year INTEGER NOT NULL,
+                fetch_timestamp DATETIME NOT NULL,
+                success BOOLEAN NOT NULL,
+                error_message TEXT
+            );
+            
+            CREATE TABLE IF NOT EXISTS csv_exports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                year INTEGER NOT NULL,
+                export_timestamp DATETIME NOT NULL,
+                file_type TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                UNIQUE(year, file_type, file_path)
+            );
+
+            -- Ballot measures results
+            CREATE TABLE IF NOT EXISTS ballot_measures (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                state_name TEXT NOT NULL,
+                description TEXT NOT NULL,
+                category TEXT,
+                summary TEXT,
+                race_call_status TEXT NOT NULL,
+                last_updated DATETIME NOT NULL,
+                precincts_reporting INTEGER NOT NULL,
+                precincts_total INTEGER NOT NULL,
+                precincts_reporting_pct REAL NOT NULL,
+                expected_vote_pct REAL,
+                total_votes INTEGER NOT NULL,
+                candidate_id TEXT NOT NULL,
+                option_name TEXT NOT NULL,
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+
+            -- House races
+            CREATE TABLE IF NOT EXISTS house_races (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                state_name TEXT NOT NULL,
+                office_id TEXT NOT NULL,
+                seat_name TEXT,
+                seat_num TEXT,
+                race_call_status TEXT NOT NULL,
+                last_updated DATETIME NOT NULL,
+                precincts_reporting INTEGER NOT NULL,
+                precincts_total INTEGER NOT NULL,
+                precincts_reporting_pct REAL NOT NULL,
+                expected_vote_pct REAL,
+                total_votes INTEGER NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                last_name TEXT NOT NULL,
+                party TEXT NOT NULL,
+                incumbent BOOLEAN,
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+
+            -- Governor races
+            CREATE TABLE IF NOT EXISTS governor_races (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                state_name TEXT NOT NULL,
+                race_call_status TEXT NOT NULL,
+                last_updated DATETIME NOT NULL,
+                precincts_reporting INTEGER NOT NULL,
+                precincts_total INTEGER NOT NULL,
+                precincts_reporting_pct REAL NOT NULL,
+                expected_vote_pct REAL,
+                total_votes INTEGER NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                last_name TEXT NOT NULL,
+                party TEXT NOT NULL,
+                incumbent BOOLEAN,
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+
+            -- Senate races
+            CREATE TABLE IF NOT EXISTS senate_races (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                state_name TEXT NOT NULL,
+                office_id TEXT NOT NULL,
+                seat_name TEXT,
+                seat_num TEXT,
+                race_call_status TEXT NOT NULL,
+                last_updated DATETIME NOT NULL,
+                precincts_reporting INTEGER NOT NULL,
+                precincts_total INTEGER NOT NULL,
+                precincts_reporting_pct REAL NOT NULL,
+                expected_vote_pct REAL,
+                total_votes INTEGER NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                last_name TEXT NOT NULL,
+                party TEXT NOT NULL,
+                incumbent BOOLEAN,
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+
+            -- Presidential races
+            CREATE TABLE IF NOT EXISTS presidential_races (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                state_name TEXT NOT NULL,
+                race_call_status TEXT NOT NULL,
+                last_updated DATETIME NOT NULL,
+                precincts_reporting INTEGER NOT NULL,
+                precincts_total INTEGER NOT NULL,
+                precincts_reporting_pct REAL NOT NULL,
+                expected_vote_pct REAL,
+                total_votes INTEGER NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                last_name TEXT NOT NULL,
+                party TEXT NOT NULL,
+                incumbent BOOLEAN,
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+
+            -- County-level results for all race types
+            CREATE TABLE IF NOT EXISTS county_results (
+                race_id TEXT NOT NULL,
+                state_postal TEXT NOT NULL,
+                county_name TEXT,               -- Allow NULL
+                county_fips TEXT,               -- Allow NULL
+                county_id TEXT,                 -- Allow NULL
+                precincts_reporting INTEGER,    -- Allow NULL
+                precincts_total INTEGER,        -- Allow NULL
+                precincts_reporting_pct REAL,   -- Allow NULL
+                expected_vote_pct REAL,         -- Allow NULL
+                total_votes INTEGER,            -- Allow NULL
+                registered_voters INTEGER,       -- Allow NULL
+                last_updated DATETIME NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_name TEXT,                -- Allow NULL
+                last_name TEXT,                 -- Allow NULL
+                option_name TEXT,               -- Allow NULL
+                party TEXT,                     -- Allow NULL
+                vote_count INTEGER NOT NULL,
+                vote_pct REAL NOT NULL
+            );
+        ''')
+
+        for table_name in self.PRIMARY_KEYS:
+            # Integer election year derived from the race_id prefix, for
+            # filtering by year without string slicing in every query
+            has_year = any(
+                column['name'] == 'year'
+                for column in self.conn.execute(f"PRAGMA table_xinfo({table_name})")
+            )
+            if not has_year:
+                self.conn.execute(
+                    f"ALTER TABLE {table_name} ADD COLUMN year INTEGER "
+                    f"GENERATED ALWAYS AS (CAST(SUBSTR(race_id, 1, 4) AS INTEGER)) VIRTUAL"
+                )
+
+            self.create_table_indexes(table_name)
+
+    def create_table_indexes(self, table_name: str):
+        """Create the unique key index and the yearly summary index for a result table."""
+        # Databases created before the keys moved out of the table
+        # definitions still carry an inline PRIMARY KEY; leave those alone.
+        has_inline_key = any(
+            index['origin'] == 'pk'
+            for index in self.conn.execute(f"PRAGMA index_list({table_name})")
+        )
+        if not has_inline_key:
+            columns = ', '.join(self.PRIMARY_KEYS[table_name])
+            self.conn.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS pk_{table_name} ON {table_name} ({columns})"
+            )
+
+        # Covering index for the per-year GROUP BY in get_database_summary;
+        # the leading expression must match the query's SUBSTR(race_id, 1, 4)
+        columns = ', '.join(self.YEAR_INDEX_COLUMNS[table_name])
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table_name}_year "
+            f"ON {table_name} (SUBSTR(race_id, 1, 4), {columns})"
+        )
+
+    def drop_table_indexes(self, table_name: str):
+        """Drop the indexes created by create_table_indexes ahead of a bulk load."""
+        self.conn.execute(f"DROP INDEX IF EXISTS pk_{table_name}")
+        self.conn.execute(f"DROP INDEX IF EXISTS ix_{table_name}_year")
+
+    def should_rebuild_indexes(self, table_name: str, incoming_rows: int) -> bool:
+        """Whether a load is big enough that rebuilding the table indexes beats maintaining them.
+
+        Called after the old rows for the incoming races have been deleted;
+        once the new rows are at least as many as those left in the table, a
+        single sort-and-build is cheaper than one B-tree insert per row.
+        """
+        has_index = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+            (f"pk_{table_name}",)
+        ).fetchone()
+        if not has_index:
+            return False
+        existing_rows = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        return incoming_rows >= existing_rows
     
     def record_fetch(self, year: int, success: bool, error_message: Optional[str] = None):
         """Record an attempt to fetch election data."""
-        with self.conn:
-            self.conn.execute('''
-                INSERT INTO election_fetches (year, fetch_timestamp, success, error_message)
-                VALUES (?, ?, ?, ?)
-            ''', (year, datetime.now(), success, error_message))
+        # A single statement is its own transaction in autocommit mode
+        self.conn.execute(self.SQL_RECORD_FETCH, (year, datetime.now(), success, error_message))
     
     def record_csv_export(self, year: int, file_type: str, file_path: str):
         """Record a CSV export."""
-        with self.conn:
-            self.conn.execute('''
-                INSERT OR REPLACE INTO csv_exports 
-                (year, export_timestamp, file_type, file_path)
-                VALUES (?, ?, ?, ?)
-            ''', (year, datetime.now(), file_type, file_path))
+        self.conn.execute(self.SQL_RECORD_CSV_EXPORT, (year, datetime.now(), file_type, file_path))
 
-    def load_csv_file(self, file_path: str, year: int):
-        """Load data from a CSV file into appropriate table."""
-        file_name = Path(file_path).stem.lower()
-        table_name = None
+    @staticmethod
+    def frame_rows(df: pd.DataFrame) -> Iterable[tuple]:
+        """Iterate a DataFrame as row tuples of plain Python values."""
+        # Object arrays box each column once in C, which is much cheaper than
+        # itertuples() converting every cell through numpy scalars.
+        return zip(*(df[col].to_numpy(dtype=object) for col in df.columns))
+
+    def insert_sql_for(self, table_name: str, columns: List[str], row_count: int = 1) -> str:
+        """INSERT statement binding row_count rows per execution, memoized per shape."""
+        key = (table_name, tuple(columns), row_count)
+        sql = self.insert_sql.get(key)
+        if sql is None:
+            placeholders = f"({', '.join('?' for _ in columns)})"
+            sql = (f"INSERT INTO {table_name} ({', '.join(columns)}) "
+                   f"VALUES {', '.join([placeholders] * row_count)}")
+            self.insert_sql[key] = sql
+        return sql
+
+    def insert_rows(self, table_name: str, columns: List[str], rows: Iterable[tuple]):
+        """Bulk insert row tuples (in column order) with batched executemany.
+
+        Rows are bound several at a time through a multi-row VALUES list, so
+        each statement step inserts a whole group instead of a single row.
+        """
+        rows_per_statement = max(1, min(self.ROWS_PER_INSERT, self.MAX_BOUND_PARAMETERS // len(columns)))
+        multi_sql = self.insert_sql_for(table_name, columns, rows_per_statement)
+        single_sql = self.insert_sql_for(table_name, columns)
+
+        rows = iter(rows)
+        with self.transaction():
+            while True:
+                batch = list(islice(rows, self.INSERT_BATCH_SIZE))
+                if not batch:
+                    break
+                grouped = len(batch) - len(batch) % rows_per_statement
+                if grouped:
+                    self.conn.executemany(multi_sql, (
+                        list(chain.from_iterable(batch[i:i + rows_per_statement]))
+                        for i in range(0, grouped, rows_per_statement)
+                    ))
+                if grouped < len(batch):
+                    self.conn.executemany(single_sql, batch[grouped:])
+
+    def purge_races(self, table_name: str, race_ids: Iterable[str]):
+        """Delete all rows for the given races from a table.
+
+        The ids go through an indexed temp table rather than an IN (?, ?, ...)
+        list, which would hit SQLite's bound-parameter limit on big files and
+        need a fresh statement for every distinct id count.
+        """
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS purge_race_ids (race_id TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM purge_race_ids")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO purge_race_ids (race_id) VALUES (?)",
+            ((race_id,) for race_id in race_ids)
+        )
+        self.conn.execute(
+            f"DELETE FROM {table_name} WHERE race_id IN (SELECT race_id FROM purge_race_ids)"
+        )
+
+    def declared_types(self, table_name: str) -> Dict[str, str]:
+        """Map a table's columns to their declared (upper-cased) SQL types."""
+        return {
+            row['name']: row['type'].upper()
+            for row in self.conn.execute(f"PRAGMA table_info({table_name})")
+        }
+
+    def can_fast_import(self, file_path: str, table_name: str) -> bool:
+        """Check whether a CSV can be loaded through the sqlite3 shell."""
+        # The shell is a second writer, so it can't run while this connection
+        # holds the write lock, and it can't see an in-memory database.
+        if self.conn.in_transaction or self.db_path == ':memory:':
+            return False
+        if shutil.which('sqlite3') is None or '"' in str(file_path):
+            return False
+        # .import only reads plain text
+        if str(file_path).endswith('.gz'):
+            return False
+
+        # Count CSV records (not lines, which quoted newlines would inflate),
+        # stopping at the threshold rather than reading the whole file
+        with open(file_path, newline='', encoding='utf-8') as f:
+            records = csv.reader(f)
+            header = next(records, [])
+            row_count = sum(1 for _ in islice(records, self.FAST_IMPORT_MIN_ROWS))
+        if row_count < self.FAST_IMPORT_MIN_ROWS:
+            return False
+
+        # Every CSV column has to exist in the table; order doesn't matter
+        # because rows are copied out of the staging table by name.
+        table_columns = set(self.declared_types(table_name))
+        return set(header) <= table_columns
+
+    def cleanup_expression(self, table_name: str, column: str, declared_type: str) -> str:
+        """SQL that applies the pandas path's NaN/boolean cleanup to a raw text column."""
+        if column == 'incumbent':
+            return f"CASE WHEN {column} IN ('True', 'true', '1') THEN 1 ELSE 0 END"
+
+        na_list = ', '.join(f"'{na}'" for na in self.NA_STRINGS)
+        value = f"CASE WHEN {column} IN ({na_list}) THEN NULL ELSE {column} END"
+        if table_name == 'county_results' and column in self.COUNTY_DEFAULTS:
+            return f"COALESCE({value}, '{self.COUNTY_DEFAULTS[column]}')"
+        if declared_type in ('INTEGER', 'REAL', 'BOOLEAN'):
+            # Text literal so the fill matches the raw column's type; the
+            # column affinity still stores it as a number
+            return f"COALESCE({value}, '0')"
+        return value
+
+    def fast_import_csv(self, file_path: str, table_name: str) -> int:
+        """Load a CSV using the sqlite3 shell's C CSV reader.
+
+        The shell imports into a TEXT-only staging table, then the rows are
+        cleaned and copied into the real table in one transaction. Returns the
+        number of rows loaded.
+        """
+        staging = f"staging_{table_name}"
+        declared_types = self.declared_types(table_name)
+
+        self.conn.execute(f"DROP TABLE IF EXISTS {staging}")
+        subprocess.run(
+            ['sqlite3', self.db_path, f'.import --csv "{file_path}" {staging}'],
+            check=True, capture_output=True, text=True
+        )
+
+        try:
+            columns = [row['name'] for row in self.conn.execute(f"PRAGMA table_info({staging})")]
+            select_list = ', '.join(
+                self.cleanup_expression(table_name, col, declared_types[col]) for col in columns
+            )
+            with self.transaction():
+                self.conn.execute(
+                    f"DELETE FROM {table_name} WHERE race_id IN (SELECT race_id FROM {staging})"
+                )
+                row_count = self.conn.execute(f"SELECT COUNT(*) FROM {staging}").fetchone()[0]
+
+                rebuild_indexes = self.should_rebuild_indexes(table_name, row_count)
+                if rebuild_indexes:
+                    self.drop_table_indexes(table_name)
+
+                self.conn.execute(
+                    f"INSERT INTO {table_name} ({', '.join(columns)}) "
+                    f"SELECT {select_list} FROM {staging}"
+                )
+
+                if rebuild_indexes:
+                    self.create_table_indexes(table_name)
+                    self.conn.execute(f"ANALYZE {table_name}")
+        finally:
+            self.conn.execute(f"DROP TABLE IF EXISTS {staging}")
+
+        return row_count
+
+    @classmethod
+    def read_csv(cls, file_path: str, table_name: str, declared_types: Dict[str, str]):
+        """Read and clean a CSV, with pyarrow's parser when it's installed."""
+        if pa_csv is not None:
+            return cls.read_csv_arrow(file_path, table_name, declared_types)
+        return cls.read_csv_pandas(file_path, table_name, declared_types)
+
+    @classmethod
+    def read_csv_pandas(cls, file_path: str, table_name: str, declared_types: Dict[str, str]):
+        """Read and clean a CSV with pandas, text columns typed by the table.
+
+        Returns (columns, race_ids, row_count, rows) where rows yields plain
+        tuples in column order. Text columns are read as strings and only
+        NA_STRINGS count as missing, so the stored values match the pyarrow
+        and sqlite3 shell paths (county_fips keeps leading zeros, and empty
+        text columns stay NULL rather than becoming 0.0).
+        """
+        text_columns = {
+            name: str for name, declared_type in declared_types.items()
+            if declared_type not in ('INTEGER', 'REAL', 'BOOLEAN')
+        }
+        df = pd.read_csv(
+            file_path,
+            dtype=text_columns,
+            keep_default_na=False,
+            na_values=list(cls.NA_STRINGS)
+        )
         
-        # Updated file pattern matching
+        # Convert boolean columns if they exist
+        if 'incumbent' in df.columns:
+            df['incumbent'] = df['incumbent'].fillna(False).to_numpy(dtype=bool)
+        
+        # Fill NaN values in one pass: numeric columns get 0, and county
+        # results get placeholders for missing (non-numeric) identifiers
+        fill_map = {col: 0 for col in df.select_dtypes(include='number').columns}
+        if table_name == 'county_results':
+            fill_map = {**cls.COUNTY_DEFAULTS, **fill_map}
+        df.fillna(value=fill_map, inplace=True)
+        
+        # Fill NaN values with None for non-numeric columns
+        obj_cols = df.select_dtypes(include='object').columns
+        df[obj_cols] = df[obj_cols].astype(object).where(df[obj_cols].notna(), None)
+        
+        # Special handling for county results
+        if table_name == 'county_results':
+            df = df.astype({'vote_count': int, 'vote_pct': float})
+
+        return list(df.columns), df['race_id'].unique(), len(df), cls.frame_rows(df)
+
+    @classmethod
+    def read_csv_arrow(cls, file_path: str, table_name: str, declared_types: Dict[str, str]):
+        """Read and clean a CSV with pyarrow, typed by the table's declared columns.
+
+        Same return shape and values as read_csv_pandas, with the parsing
+        and fills done in C++.
+        """
+        arrow_types = {'INTEGER': pa.int64(), 'REAL': pa.float64(), 'BOOLEAN': pa.bool_()}
+        column_types = {
+            name: arrow_types.get(declared_type, pa.string())
+            for name, declared_type in declared_types.items()
+        }
+        table = pa_csv.read_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=list(cls.NA_STRINGS),
+                strings_can_be_null=True
+            )
+        )
+
+        # Same fills as the pandas path, applied column by column in C++
+        for i, name in enumerate(table.column_names):
+            column = table.column(i)
+            if name == 'incumbent':
+                fill = False
+            elif table_name == 'county_results' and name in cls.COUNTY_DEFAULTS:
+                fill = cls.COUNTY_DEFAULTS[name]
+            elif pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+                fill = 0
+            else:
+                continue
+            table = table.set_column(i, name, pc.fill_null(column, fill))
+
+        def rows():
+            for batch in table.to_batches(max_chunksize=cls.INSERT_BATCH_SIZE):
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+
+        race_ids = pc.unique(table.column('race_id')).to_pylist()
+        return table.column_names, race_ids, table.num_rows, rows()
+
+    @staticmethod
+    def find_csv_files(data_path: Path) -> List[Path]:
+        """Every plain or gzipped CSV under a directory."""
+        return list(chain.from_iterable(data_path.rglob(pattern) for pattern in _CSV_PATTERNS))
+
+    @staticmethod
+    def open_csv(file_path: Union[str, Path]):
+        """Open a CSV for text reading, decompressing .csv.gz files."""
+        if str(file_path).endswith('.gz'):
+            return gzip.open(file_path, 'rt', newline='', encoding='utf-8')
+        return open(file_path, newline='', encoding='utf-8')
+
+    @staticmethod
+    def table_for_file(file_path: Union[str, Path]) -> Optional[str]:
+        """Pick the destination table from a CSV's file name."""
+        file_name = Path(file_path).stem.lower()
         if any(pattern in file_name for pattern in ['_detail', '_detailed']):
-            table_name = 'county_results'
-            print(f"Processing county results file: {file_name}")
+            return 'county_results'
         elif 'ballot' in file_name:
-            table_name = 'ballot_measures'
+            return 'ballot_measures'
         elif 'house' in file_name:
-            table_name = 'house_races'
+            return 'house_races'
         elif 'governor' in file_name:
-            table_name = 'governor_races'
+            return 'governor_races'
         elif 'senate' in file_name:
-            table_name = 'senate_races'
+            return 'senate_races'
         elif 'president' in file_name:
-            table_name = 'presidential_races'
-        
-        print(f"\nProcessing {file_path} -> {table_name}")
+            return 'presidential_races'
+        return None
+
+    def replace_rows(self, table_name: str, columns: List[str], race_ids: Iterable[str],
+                     row_count: int, rows: Iterable[tuple]):
+        """Atomically replace the given races in a table with freshly read rows."""
+        with self.transaction():
+            self.purge_races(table_name, race_ids)
+            
+            # Load new data, rebuilding the indexes afterwards for big loads
+            rebuild_indexes = self.should_rebuild_indexes(table_name, row_count)
+            if rebuild_indexes:
+                self.drop_table_indexes(table_name)
+
+            self.insert_rows(table_name, columns, rows)
+
+            if rebuild_indexes:
+                self.create_table_indexes(table_name)
+                self.conn.execute(f"ANALYZE {table_name}")
+
+    def load_csv_file(self, file_path: str, year: int):
+        """Load data from a CSV file into appropriate table."""
+        table_name = self.table_for_file(file_path)
+        self.announce_file(Path(file_path), table_name)
             
         if table_name:
             try:
-                # Read CSV
-                df = pd.read_csv(file_path)
-                print(f"Read {len(df)} rows with columns: {', '.join(df.columns)}")
-                
-                # Convert boolean columns if they exist
-                if 'incumbent' in df.columns:
-                    df['incumbent'] = df['incumbent'].fillna(False).astype(bool)
-                
-                # Fill NaN values appropriately based on column type
-                numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-                for col in numeric_cols:
-                    df[col] = df[col].fillna(0)
-                
-                # Fill NaN values with None for non-numeric columns
-                string_cols = df.select_dtypes(include=['object']).columns
-                for col in string_cols:
-                    df[col] = df[col].where(pd.notnull(df[col]), None)
-                
-                # Special handling for county results
-                if table_name == 'county_results':
-                    # Ensure required columns have values
-                    df['county_name'] = df['county_name'].fillna('Unknown')
-                    df['county_fips'] = df['county_fips'].fillna('00000')
-                    df['county_id'] = df['county_id'].fillna('0')
-                    df['vote_count'] = df['vote_count'].fillna(0).astype(int)
-                    df['vote_pct'] = df['vote_pct'].fillna(0.0).astype(float)
-                
-                # Clear existing data for these race_ids
-                race_ids = df['race_id'].unique()
-                with self.conn:  # Ensure atomic transaction
-                    self.conn.execute(
-                        f"DELETE FROM {table_name} WHERE race_id IN ({','.join('?' for _ in race_ids)})",
-                        list(race_ids)
-                    )
-                    
-                    # Load new data
-                    df.to_sql(table_name, self.conn, if_exists='append', index=False)
-                
-                print(f"Successfully loaded {len(df)} rows into {table_name}")
-                
-                # Record the export
-                self.record_csv_export(year, table_name, str(file_path))
+                # Large files skip pandas entirely when the sqlite3 shell is available
+                if self.can_fast_import(file_path, table_name):
+                    self.fast_load_file(file_path, year, table_name)
+                    return
+
+                parsed = self.read_csv(file_path, table_name, self.declared_types(table_name))
+                self.store_rows(file_path, year, table_name, *parsed)
                 
             except Exception as e:
-                print(f"Error loading {file_path}: {str(e)}")
-                print(f"Full error details: {e.__class__.__name__}")
-                if hasattr(e, '__cause__'):
-                    print(f"Caused by: {e.__cause__}")
-                import traceback
-                traceback.print_exc()
+                self.report_load_error(file_path, e)
+
+    def fast_load_file(self, file_path: str, year: int, table_name: str):
+        """Load one file through the sqlite3 shell and record the export."""
+        row_count = self.fast_import_csv(file_path, table_name)
+        print(f"Successfully loaded {row_count} rows into {table_name} via sqlite3 .import")
+        self.record_csv_export(year, table_name, str(file_path))
+
+    def store_rows(self, file_path: str, year: int, table_name: str, columns: List[str],
+                   race_ids: Iterable[str], row_count: int, rows: Iterable[tuple]):
+        """Write one file's parsed rows and record the export."""
+        print(f"Read {row_count} rows with columns: {', '.join(columns)}")
+        
+        self.replace_rows(table_name, columns, race_ids, row_count, rows)
+        
+        print(f"Successfully loaded {row_count} rows into {table_name}")
+        
+        # Record the export
+        self.record_csv_export(year, table_name, str(file_path))
+
+    @staticmethod
+    def report_load_error(file_path: str, e: Exception):
+        """Print why a CSV failed to load."""
+        print(f"Error loading {file_path}: {str(e)}")
+        print(f"Full error details: {e.__class__.__name__}")
+        if hasattr(e, '__cause__'):
+            print(f"Caused by: {e.__cause__}")
+        import traceback
+        traceback.print_exc()
 
     def load_from_directory(self, data_dir: str):
         """Load all CSV files from a directory structure."""
         data_path = Path(data_dir)
-        found_files = list(data_path.rglob('*.csv'))
+        found_files = self.find_csv_files(data_path)
         
         print(f"\nFound {len(found_files)} CSV files in {data_path}")
         
         # Sort files to handle base files before detailed files
         found_files.sort(key=lambda x: '_detail' in x.name.lower())
         
-        # Start a transaction for all loads
-        with self.conn:
-            for path in found_files:
-                try:
-                    print(f"\nProcessing file: {path}")
-                    print(f"Parent directory: {path.parent.name}")
-                    
-                    # Get year from directory or filename
-                    year_str = path.parent.name
+        # Work out each file's year and table up front so parsing can start
+        # before the first write
+        jobs = []
+        for path in found_files:
+            print(f"\nProcessing file: {path}")
+            print(f"Parent directory: {path.parent.name}")
+            
+            year = self.year_for_path(path)
+            if year is None:
+                continue
+            
+            table_name = self.table_for_file(path)
+            if table_name is None:
+                print(f"\nProcessing {path} -> {table_name}")
+                continue
+            jobs.append((path, year, table_name))
+        
+        # Parse in worker processes when there are cores to spare; all writes
+        # stay on this connection. Files go through in batches of
+        # CHECKPOINT_EVERY_FILES, so at most one batch of parsed rows is held
+        # in memory, and each batch is committed as one transaction.
+        declared_types = {table_name: self.declared_types(table_name) for _, _, table_name in jobs}
+        workers = min(self.PARSE_WORKERS or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+            for start in range(0, len(jobs), self.CHECKPOINT_EVERY_FILES):
+                batch = jobs[start:start + self.CHECKPOINT_EVERY_FILES]
+                
+                # Large files go through the sqlite3 shell instead
+                fast, pending = [], []
+                for job in batch:
+                    try:
+                        use_shell = self.can_fast_import(str(job[0]), job[2])
+                    except Exception as e:
+                        self.report_load_error(str(job[0]), e)
+                        continue
+                    (fast if use_shell else pending).append(job)
+                
+                if executor is not None:
+                    futures = {
+                        executor.submit(_prepare_rows, str(path), table_name, declared_types[table_name]):
+                            (path, year, table_name)
+                        for path, year, table_name in pending
+                    }
+                    # Each file is written as soon as its parse finishes
+                    parsed = ((futures[future], future.result) for future in as_completed(futures))
+                else:
+                    parsed = (
+                        (job, partial(self.read_csv, str(job[0]), job[2], declared_types[job[2]]))
+                        for job in pending
+                    )
+                
+                # The shell is a second writer, so its imports run (while the
+                # workers parse) before this connection takes the write lock
+                for path, year, table_name in fast:
+                    self.announce_file(path, table_name)
                     try:
-                        year = int(year_str)
-                        print(f"Using year from directory: {year}")
-                    except ValueError:
-                        # Try to extract year from filename
-                        if path.stem[0:4].isdigit():
-                            year = int(path.stem[0:4])
-                            print(f"Using year from filename: {year}")
-                        else:
-                            import re
-                            year_match = re.search(r'20\d{2}', path.stem)
-                            if year_match:
-                                year = int(year_match.group())
-                                print(f"Found year in filename: {year}")
-                            else:
-                                print(f"Skipping {path}: Cannot determine year")
-                                continue
-                    
-                    self.load_csv_file(str(path), year)
-                        
+                        self.fast_load_file(str(path), year, table_name)
+                    except Exception as e:
+                        self.report_load_error(str(path), e)
+                
+                # Each file runs in its own savepoint within the batch transaction
+                with self.transaction():
+                    for (path, year, table_name), parse in parsed:
+                        self.announce_file(path, table_name)
+                        try:
+                            self.store_rows(str(path), year, table_name, *parse())
+                        except Exception as e:
+                            self.report_load_error(str(path), e)
+                self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    @staticmethod
+    def announce_file(path: Path, table_name: str):
+        """Print which table a file is being loaded into."""
+        if table_name == 'county_results':
+            print(f"Processing county results file: {path.stem.lower()}")
+        print(f"\nProcessing {path} -> {table_name}")
+
+    @staticmethod
+    def year_for_path(path: Path) -> Optional[int]:
+        """Get a CSV's election year from its directory or file name."""
+        year_str = path.parent.name
+        if year_str.isdigit():
+            year = int(year_str)
+            print(f"Using year from directory: {year}")
+            return year
+
+        # Try to extract year from filename
+        stem = path.stem
+        if stem[0:4].isdigit():
+            year = int(stem[0:4])
+            print(f"Using year from filename: {year}")
+            return year
+
+        year_match = _YEAR_RE.search(stem)
+        if year_match:
+            year = int(year_match.group())
+            print(f"Found year in filename: {year}")
+            return year
+
+        print(f"Skipping {path}: Cannot determine year")
+        return None
+
+    def bulk_ingest_with_duckdb(self, data_dir: str):
+        """Load all CSV files from a directory, scanning each table's files with DuckDB.
+
+        DuckDB parses and cleans every file for a table in one parallel scan,
+        and the cleaned rows are then written through insert_rows. A table
+        whose files can't be loaded together (e.g. the same race appears in
+        two files) is retried one file at a time with load_csv_file. Without
+        duckdb installed this is just load_from_directory.
+        """
+        if duckdb is None:
+            print("duckdb is not installed; falling back to load_from_directory")
+            return self.load_from_directory(data_dir)
+
+        data_path = Path(data_dir)
+        files_by_table: Dict[str, List[tuple]] = {}
+        for path in sorted(self.find_csv_files(data_path)):
+            table_name = self.table_for_file(path)
+            year = self.year_for_path(path) if table_name else None
+            if year is not None:
+                files_by_table.setdefault(table_name, []).append((path, year))
+
+        print(f"\nFound {sum(map(len, files_by_table.values()))} CSV files in {data_path}")
+
+        scanner = duckdb.connect()
+        try:
+            for table_name, files in files_by_table.items():
+                print(f"\nScanning {len(files)} files -> {table_name} with DuckDB")
+                try:
+                    row_count = self.duckdb_load_table(scanner, table_name, [str(p) for p, _ in files])
                 except Exception as e:
-                    print(f"Error processing {path}: {str(e)}")
-                    if hasattr(e, '__cause__'):
-                        print(f"Caused by: {e.__cause__}")
+                    print(f"Bulk load of {table_name} failed ({e}); loading files one at a time")
+                    for path, year in files:
+                        self.load_csv_file(str(path), year)
                     continue
 
+                print(f"Successfully loaded {row_count} rows into {table_name}")
+                for path, year in files:
+                    self.record_csv_export(year, table_name, str(path))
+        finally:
+            scanner.close()
+
+    def duckdb_load_table(self, scanner, table_name: str, file_paths: List[str]) -> int:
+        """Scan and clean a table's CSVs in DuckDB, then replace their races in SQLite.
+
+        Columns are read as text and go through the same cleanup_expression
+        SQL as the sqlite3 shell path. Returns the number of rows loaded.
+        """
+        declared_types = self.declared_types(table_name)
+        # The CSV sniffer is slow, so files are grouped by header and read
+        # with their columns spelled out
+        files_by_header: Dict[tuple, List[str]] = {}
+        for path in file_paths:
+            with self.open_csv(path) as f:
+                header = tuple(next(csv.reader(f)))
+            files_by_header.setdefault(header, []).append(path)
+
+        columns = list(dict.fromkeys(col for header in files_by_header for col in header))
+        unknown = [col for col in columns if col not in declared_types]
+        if unknown:
+            raise ValueError(f"unknown columns {', '.join(unknown)}")
+
+        scanner.execute(
+            f"CREATE OR REPLACE TEMP TABLE staged ({', '.join(f'{col} VARCHAR' for col in columns)})"
+        )
+        for header, paths in files_by_header.items():
+            file_list = ', '.join("'" + path.replace("'", "''") + "'" for path in paths)
+            column_types = ', '.join(f"'{col}': 'VARCHAR'" for col in header)
+            select_list = ', '.join(
+                self.cleanup_expression(table_name, col, declared_types[col]) for col in header
+            )
+            scanner.execute(
+                f"INSERT INTO staged ({', '.join(header)}) SELECT {select_list} "
+                f"FROM read_csv([{file_list}], header=true, auto_detect=false, "
+                f"delim=',', quote='\"', escape='\"', columns={{{column_types}}})"
+            )
+        try:
+            race_ids = [row[0] for row in scanner.execute("SELECT DISTINCT race_id FROM staged").fetchall()]
+            row_count = scanner.execute("SELECT COUNT(*) FROM staged").fetchone()[0]
+
+            # Catch duplicate keys here, before anything is written to SQLite
+            key_list = ', '.join(self.PRIMARY_KEYS[table_name])
+            key_count = scanner.execute(
+                f"SELECT COUNT(*) FROM (SELECT DISTINCT {key_list} FROM staged)"
+            ).fetchone()[0]
+            if key_count != row_count:
+                raise ValueError(f"{row_count - key_count} rows repeat a ({key_list}) key")
+
+            def rows():
+                scanner.execute(f"SELECT {', '.join(columns)} FROM staged")
+                while batch := scanner.fetchmany(self.INSERT_BATCH_SIZE):
+                    yield from batch
+
+            self.replace_rows(table_name, columns, race_ids, row_count, rows())
+        finally:
+            scanner.execute("DROP TABLE IF EXISTS staged")
+
+        return row_count
+
     def clear_data(self):
         """Clear all data from tables except tracking tables."""
-        with self.conn:
-            cursor = self.conn.cursor()
-            # Get list of all tables
-            tables = cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT IN ('election_fetches', 'csv_exports')
-            """).fetchall()
-            
-            print("Clearing tables:")
+        # Get list of all tables
+        tables = self.conn.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name NOT IN ('election_fetches', 'csv_exports')
+        """).fetchall()
+        
+        print("Clearing tables:")
+        for (table_name,) in tables:
+            print(f"  - {table_name}")
+        
+        # One transaction, rolled back if any DELETE fails. An unqualified
+        # DELETE already gets SQLite's truncate optimization (whole pages
+        # freed without visiting each row), so this is as cheap as dropping
+        # and recreating the tables and keeps their indexes in place.
+        with self.transaction():
             for (table_name,) in tables:
-                print(f"  - {table_name}")
-                cursor.execute(f"DELETE FROM {table_name}")
-            
-            print("All data cleared")
+                self.conn.execute(f"DELETE FROM {table_name}")
+        
+        print("All data cleared")
 
     def get_database_summary(self) -> dict:
         """Get a summary of database contents."""
-        cursor = self.conn.cursor()
+        with self.reader() as conn:
+            return self.build_summary(conn.cursor())
+
+    def build_summary(self, cursor: sqlite3.Cursor) -> dict:
+        """Run the summary queries on the given cursor."""
         summary = {
             "tables": {},
             "yearly_stats": {},
@@ -350,92 +980,83 @@ class ElectionDatabase:
             'senate_races', 'presidential_races', 'county_results',
             'election_fetches', 'csv_exports'
         ]
-        
-        for table in race_tables:
-            try:
-                count = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-                summary["tables"][table] = count
-            except sqlite3.OperationalError:
-                print(f"Warning: Table {table} not found")
-                summary["tables"][table] = 0
-        
-        # Get yearly statistics for regular races
-        for table, label in {
+        person_tables = {
             'house_races': 'House',
             'governor_races': 'Governor',
             'senate_races': 'Senate',
             'presidential_races': 'Presidential'
-        }.items():
-            try:
-                yearly_stats = cursor.execute(f"""
-                    SELECT SUBSTR(race_id, 1, 4) as year,
-                           COUNT(DISTINCT race_id) as races,
-                           COUNT(DISTINCT state_postal) as states,
-                           COUNT(*) as candidates,
-                           COUNT(DISTINCT party) as parties,
-                           SUM(CASE WHEN incumbent = 1 THEN 1 ELSE 0 END) as incumbents
-                    FROM {table}
-                    GROUP BY SUBSTR(race_id, 1, 4)
-                """).fetchall()
-                
-                for year, races, states, candidates, parties, incumbents in yearly_stats:
-                    if year not in summary["yearly_stats"]:
-                        summary["yearly_stats"][year] = {}
-                    summary["yearly_stats"][year][label] = {
-                        "races": races,
-                        "states": states,
-                        "candidates": candidates,
-                        "unique_parties": parties,
-                        "incumbents": incumbents
-                    }
-            except sqlite3.OperationalError as e:
-                print(f"Warning: Error getting stats for {table}: {e}")
+        }
 
-        # Get ballot measure statistics
-        try:
-            ballot_stats = cursor.execute("""
-                SELECT SUBSTR(race_id, 1, 4) as year,
-                       COUNT(DISTINCT race_id) as races,
-                       COUNT(DISTINCT state_postal) as states,
-                       COUNT(*) as options,
-                       COUNT(DISTINCT category) as categories
+        existing = {
+            row[0] for row in
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        }
+        for table in race_tables:
+            if table not in existing:
+                print(f"Warning: Table {table} not found")
+
+        # Everything comes back from one UNION ALL as
+        # (table, year, stat1, ..., stat5); a NULL year marks a row count.
+        # Each member's GROUP BY is served by the table's covering year index.
+        selects = [
+            f"SELECT '{table}', NULL, COUNT(*), NULL, NULL, NULL, NULL FROM {table}"
+            for table in race_tables if table in existing
+        ]
+        selects += [
+            f"""SELECT '{table}', SUBSTR(race_id, 1, 4),
+                       COUNT(DISTINCT race_id), COUNT(DISTINCT state_postal), COUNT(*),
+                       COUNT(DISTINCT party), SUM(CASE WHEN incumbent = 1 THEN 1 ELSE 0 END)
+                FROM {table}
+                GROUP BY SUBSTR(race_id, 1, 4)"""
+            for table in person_tables if table in existing
+        ]
+        if 'ballot_measures' in existing:
+            selects.append("""SELECT 'ballot_measures', SUBSTR(race_id, 1, 4),
+                       COUNT(DISTINCT race_id), COUNT(DISTINCT state_postal), COUNT(*),
+                       COUNT(DISTINCT category), NULL
                 FROM ballot_measures
-                GROUP BY SUBSTR(race_id, 1, 4)
-            """).fetchall()
-            
-            for year, races, states, options, categories in ballot_stats:
-                if year not in summary["yearly_stats"]:
-                    summary["yearly_stats"][year] = {}
-                summary["yearly_stats"][year]["Ballot Measures"] = {
-                    "races": races,
-                    "states": states,
-                    "options": options,
-                    "categories": categories
-                }
-        except sqlite3.OperationalError as e:
-            print(f"Warning: Error getting ballot measure stats: {e}")
+                GROUP BY SUBSTR(race_id, 1, 4)""")
+        if 'county_results' in existing:
+            selects.append("""SELECT 'county_results', SUBSTR(race_id, 1, 4),
+                       COUNT(DISTINCT race_id), COUNT(DISTINCT county_fips),
+                       COUNT(DISTINCT state_postal), NULL, NULL
+                FROM county_results
+                GROUP BY SUBSTR(race_id, 1, 4)""")
 
-        # Get county-level statistics
         try:
-            county_stats = cursor.execute("""
-                SELECT SUBSTR(race_id, 1, 4) as year,
-                       COUNT(DISTINCT race_id) as races,
-                       COUNT(DISTINCT county_fips) as counties,
-                       COUNT(DISTINCT state_postal) as states
-                FROM county_results
-                GROUP BY SUBSTR(race_id, 1, 4)
-            """).fetchall()
-            
-            for year, races, counties, states in county_stats:
-                if year not in summary["yearly_stats"]:
-                    summary["yearly_stats"][year] = {}
-                summary["yearly_stats"][year]["County Details"] = {
-                    "races": races,
-                    "counties": counties,
-                    "states": states
-                }
+            rows = cursor.execute("\nUNION ALL\n".join(selects)).fetchall() if selects else []
         except sqlite3.OperationalError as e:
-            print(f"Warning: Error getting county stats: {e}")
+            print(f"Warning: Error getting database stats: {e}")
+            rows = []
+
+        summary["tables"] = {table: 0 for table in race_tables}
+        for table, year, a, b, c, d, e in rows:
+            if year is None:
+                summary["tables"][table] = a
+                continue
+
+            year_stats = summary["yearly_stats"].setdefault(year, {})
+            if table in person_tables:
+                year_stats[person_tables[table]] = {
+                    "races": a,
+                    "states": b,
+                    "candidates": c,
+                    "unique_parties": d,
+                    "incumbents": e
+                }
+            elif table == 'ballot_measures':
+                year_stats["Ballot Measures"] = {
+                    "races": a,
+                    "states": b,
+                    "options": c,
+                    "categories": d
+                }
+            else:
+                year_stats["County Details"] = {
+                    "races": a,
+                    "counties": b,
+                    "states": c
+                }
         
         return summary
 
@@ -486,3 +1107,13 @@ class ElectionDatabase:
     def close(self):
         """Close the database connection."""
         self.conn.close()
+
+
+def _prepare_rows(file_path: str, table_name: str, declared_types: Dict[str, str]):
+    """Read and clean one CSV in a load_from_directory worker process.
+
+    Needs no database connection, and the rows come back as a list so the
+    result can be pickled to the writer.
+    """
+    columns, race_ids, row_count, rows = ElectionDatabase.read_csv(file_path, table_name, declared_types)
+    return columns, list(race_ids), row_count, list(rows)
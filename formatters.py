@@ -1,9 +1,56 @@
-from typing import Union, Dict, List, Optional, TextIO
-import csv
+from typing import BinaryIO, Union, Dict, Iterator, List, Optional, Set, TextIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter
+import gzip
 import os
 from datetime import datetime
 from models import ElectionRace, BallotMeasure, PersonCandidate, BallotOptionCandidate, CountyResult
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional; only ParquetDetailedWriter needs it
+    pa = pq = None
+
+# Candidate classes are never subclassed, so hot loops test them by identity
+# instead of walking the MRO with isinstance()
+_PC = PersonCandidate
+
+# Console candidate lines, parsed once and bound to str.format:
+# (incumbent marker, name, party, votes, pct) and (option, votes, pct)
+_PERSON_LINE = "  {0}{1:<30} ({2:<3}): {3:>8,} votes ({4:>5.1f}%)".format
+_OPTION_LINE = "  {0:<32}: {1:>8,} votes ({2:>5.1f}%)".format
+
+# Sort keys, evaluated in C rather than through a lambda frame per item
+_PCT = attrgetter('vote_pct')
+_KEY_RACE = attrgetter('key_race')
+_REPORTING_PCT = attrgetter('precincts_reporting_pct')
+
+# Output files are opened in binary mode with a 1 MiB buffer, so rows are
+# encoded once and reach the OS in a few large writes
+_BUFFER_SIZE = 1 << 20
+
+def _open_output(filename: str, mode: str) -> BinaryIO:
+    """Open an output CSV in binary mode; .gz names are gzip-compressed.
+
+    Compression uses level 1, which already shrinks these files several-fold
+    for little CPU. Appending to a .gz adds a gzip member, which readers
+    (gzip, pandas, pyarrow, DuckDB) decompress as one stream.
+    """
+    if filename.endswith('.gz'):
+        return gzip.open(filename, mode, compresslevel=1)
+    return open(filename, mode, buffering=_BUFFER_SIZE)
+
+def _q(value) -> str:
+    """Render one CSV field the way csv's QUOTE_MINIMAL does."""
+    if value is None:
+        return ''
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
 class ConsoleFormatter:
     """Formats election data for display or file output."""
     
@@ -25,17 +72,16 @@ class ConsoleFormatter:
         lines.append(f"Last Updated: {race.last_updated.strftime('%I:%M %p')} ET")
         lines.append(f"Status: {race.race_call_status}")
         
-        sorted_candidates = sorted(race.candidates, key=lambda x: x.vote_pct, reverse=True)
+        sorted_candidates = sorted(race.candidates, key=_PCT, reverse=True)
         
         for candidate in sorted_candidates:
-            if isinstance(candidate, PersonCandidate):
-                name = f"{candidate.first_name} {candidate.last_name}"
+            if type(candidate) is _PC:
                 incumbent = "*" if candidate.incumbent else " "
-                lines.append(f"  {incumbent}{name:<30} ({candidate.party:<3}): "
-                           f"{candidate.vote_count:>8,} votes ({candidate.vote_pct:>5.1f}%)")
+                lines.append(_PERSON_LINE(incumbent, candidate.display_name, candidate.party,
+                                          candidate.vote_count, candidate.vote_pct))
             else:
-                lines.append(f"  {candidate.option_name:<32}: "
-                           f"{candidate.vote_count:>8,} votes ({candidate.vote_pct:>5.1f}%)")
+                lines.append(_OPTION_LINE(candidate.option_name,
+                                          candidate.vote_count, candidate.vote_pct))
                 
         return "\n".join(lines)
 
@@ -57,12 +103,14 @@ class ConsoleFormatter:
         # Write detailed race information
         formatter = ConsoleFormatter()
         for category, race_list in categorized_races.items():
+            if not race_list:
+                continue
             write(f"\n\n=== {category} ===")
             
-            sorted_races = sorted(
-                race_list,
-                key=lambda x: (not x.key_race, -x.precincts_reporting_pct)
-            )
+            # Key races first, then most reported. Two stable sorts give the
+            # same order as the (not key_race, -precincts_reporting_pct) key.
+            sorted_races = sorted(race_list, key=_REPORTING_PCT, reverse=True)
+            sorted_races.sort(key=_KEY_RACE, reverse=True)
             
             for race in sorted_races[:5]:
                 write(formatter.format_race_summary(
@@ -106,9 +154,13 @@ class CSVFormatter:
         'option_name', 'vote_count', 'vote_pct'
     ]
 
+    # Offices whose CSVs carry office_id/seat_name/seat_num (CONGRESS_HEADERS)
+    SEATED_OFFICES = frozenset({'S', 'H'})
+
     @classmethod
-    def write_results(cls, categorized_races: Dict[str, List[Union[ElectionRace, BallotMeasure]]], data_dir: str = "data") -> None:
-        """Write race data to separate CSV files by type."""
+    def write_results(cls, categorized_races: Dict[str, List[Union[ElectionRace, BallotMeasure]]], data_dir: str = "data",
+                      compress: bool = False) -> None:
+        """Write race data to separate CSV files by type (gzipped with compress=True)."""
         os.makedirs(data_dir, exist_ok=True)
 
         # Extract year from first race ID (format: YYYYMMDD...)
@@ -121,112 +173,102 @@ class CSVFormatter:
         if not year:
             raise ValueError("No races found to determine year")
         
-        # Initialize row collections
+        # Initialize row collections; each holds finished CSV lines
         presidential_rows = []
         senate_rows = []
         house_rows = []
         governor_rows = []
         ballot_rows = []
+        rows_by_office = {
+            'P': presidential_rows,
+            'S': senate_rows,
+            'H': house_rows,
+            'G': governor_rows,
+        }
         
         # Process each category
         for category, races in categorized_races.items():
+            if not races:
+                continue
             for race in races:
+                # Race-level fields are quoted once and shared by every
+                # candidate line of the race
+                location = f"{_q(race.race_id)},{_q(race.state_postal)},{_q(race.state_name)}"
+                progress = (
+                    f"{_q(race.race_call_status)},{race.last_updated.isoformat()},"
+                    f"{_q(race.precincts_reporting)},{_q(race.precincts_total)},"
+                    f"{_q(race.precincts_reporting_pct)},{_q(race.expected_vote_pct)},"
+                    f"{_q(race.total_votes)}"
+                )
+                
                 if isinstance(race, BallotMeasure):
+                    prefix = (
+                        f"{location},{_q(race.description)},{_q(race.category)},"
+                        f"{_q(race.summary)},{progress}"
+                    )
                     for candidate in race.candidates:
-                        row = {
-                            'race_id': race.race_id,
-                            'state_postal': race.state_postal,
-                            'state_name': race.state_name,
-                            'description': race.description,
-                            'category': race.category,
-                            'summary': race.summary,
-                            'race_call_status': race.race_call_status,
-                            'last_updated': race.last_updated.isoformat(),
-                            'precincts_reporting': race.precincts_reporting,
-                            'precincts_total': race.precincts_total,
-                            'precincts_reporting_pct': race.precincts_reporting_pct,
-                            'expected_vote_pct': race.expected_vote_pct,
-                            'total_votes': race.total_votes,
-                            'candidate_id': candidate.candidate_id,
-                            'option_name': candidate.option_name,
-                            'vote_count': candidate.vote_count,
-                            'vote_pct': candidate.vote_pct
-                        }
-                        ballot_rows.append(row)
+                        ballot_rows.append(
+                            f"{prefix},{_q(candidate.candidate_id)},{_q(candidate.option_name)},"
+                            f"{_q(candidate.vote_count)},{_q(candidate.vote_pct)}\n"
+                        )
                 else:
-                    base_row = {
-                        'race_id': race.race_id,
-                        'state_postal': race.state_postal,
-                        'state_name': race.state_name,
-                        'race_call_status': race.race_call_status,
-                        'last_updated': race.last_updated.isoformat(),
-                        'precincts_reporting': race.precincts_reporting,
-                        'precincts_total': race.precincts_total,
-                        'precincts_reporting_pct': race.precincts_reporting_pct,
-                        'expected_vote_pct': race.expected_vote_pct,
-                        'total_votes': race.total_votes,
-                    }
+                    office_id = race.office_id
+                    rows = rows_by_office.get(office_id)
+                    if rows is None:
+                        continue
+                    if office_id in cls.SEATED_OFFICES:
+                        prefix = (
+                            f"{location},{_q(office_id)},{_q(race.seat_name)},"
+                            f"{_q(race.seat_num)},{progress}"
+                        )
+                    else:
+                        prefix = f"{location},{progress}"
                     
+                    append = rows.append
                     for candidate in race.candidates:
-                        if isinstance(candidate, PersonCandidate):
-                            row = base_row.copy()
-                            row.update({
-                                'candidate_id': candidate.candidate_id,
-                                'first_name': candidate.first_name,
-                                'last_name': candidate.last_name,
-                                'party': candidate.party,
-                                'incumbent': candidate.incumbent,
-                                'vote_count': candidate.vote_count,
-                                'vote_pct': candidate.vote_pct
-                            })
-                            
-                            if race.office_id == 'P':
-                                presidential_rows.append(row)
-                            elif race.office_id == 'S':
-                                row.update({
-                                    'office_id': race.office_id,
-                                    'seat_name': race.seat_name,
-                                    'seat_num': race.seat_num
-                                })
-                                senate_rows.append(row)
-                            elif race.office_id == 'H':
-                                row.update({
-                                    'office_id': race.office_id,
-                                    'seat_name': race.seat_name,
-                                    'seat_num': race.seat_num
-                                })
-                                house_rows.append(row)
-                            elif race.office_id == 'G':
-                                governor_rows.append(row)
+                        if type(candidate) is _PC:
+                            append(
+                                f"{prefix},{_q(candidate.candidate_id)},{_q(candidate.first_name)},"
+                                f"{_q(candidate.last_name)},{_q(candidate.party)},"
+                                f"{_q(candidate.incumbent)},{_q(candidate.vote_count)},"
+                                f"{_q(candidate.vote_pct)}\n"
+                            )
         
         # Write files
-        if presidential_rows:
-            filename = os.path.join(data_dir, f'president_{year}.csv')
-            cls.write_csv(filename, cls.PRESIDENT_HEADERS, presidential_rows)
-            
-        if senate_rows:
-            filename = os.path.join(data_dir, f'senate_{year}.csv')
-            cls.write_csv(filename, cls.CONGRESS_HEADERS, senate_rows)
-            
-        if house_rows:
-            filename = os.path.join(data_dir, f'house_{year}.csv')
-            cls.write_csv(filename, cls.CONGRESS_HEADERS, house_rows)
-            
-        if governor_rows:
-            filename = os.path.join(data_dir, f'governor_{year}.csv')
-            cls.write_csv(filename, cls.GOVERNOR_HEADERS, governor_rows)
-            
-        if ballot_rows:
-            filename = os.path.join(data_dir, f'ballot_{year}.csv')
-            cls.write_csv(filename, cls.BALLOT_HEADERS, ballot_rows)
+        ext = '.csv.gz' if compress else '.csv'
+        outputs = [
+            (f'president_{year}{ext}', cls.PRESIDENT_HEADERS, presidential_rows),
+            (f'senate_{year}{ext}', cls.CONGRESS_HEADERS, senate_rows),
+            (f'house_{year}{ext}', cls.CONGRESS_HEADERS, house_rows),
+            (f'governor_{year}{ext}', cls.GOVERNOR_HEADERS, governor_rows),
+            (f'ballot_{year}{ext}', cls.BALLOT_HEADERS, ballot_rows),
+        ]
+        jobs = [
+            (os.path.join(data_dir, name), headers, rows)
+            for name, headers, rows in outputs if rows
+        ]
+        
+        # The files are independent, so with AP_PARALLEL_CSV=1 they're
+        # written from a thread each
+        if os.environ.get('AP_PARALLEL_CSV') == '1' and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = [pool.submit(cls.write_csv, *job) for job in jobs]
+            for future in futures:
+                future.result()
+        else:
+            for job in jobs:
+                cls.write_csv(*job)
 
     @staticmethod
-    def write_csv(filename: str, headers: List[str], rows: List[dict]) -> None:
-        """Write data to CSV file."""
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(rows)
+    def write_csv(filename: str, headers: List[str], rows: List[str]) -> None:
+        """Write data to CSV file.
+
+        Rows are finished CSV lines (values rendered with _q), written after
+        the header in one encoded block.
+        """
+        with _open_output(filename, 'wb') as f:
+            f.write(','.join(headers).encode('utf-8') + b'\n')
+            f.write(''.join(rows).encode('utf-8'))
         print(f"Wrote {len(rows)} rows to {filename}")
 
 class DetailedFormatter:
@@ -246,69 +288,211 @@ class DetailedFormatter:
         'candidate_id', 'option_name', 'vote_count', 'vote_pct'
     ]
 
+    # Detailed CSVs already opened by this process, which are known to exist
+    _known_files: Set[str] = set()
+
     @classmethod
     def write_detailed_results(cls, race_type: str, race_id: str, 
                              county_results: List[CountyResult],
-                             candidate_meta: dict, data_dir: str = "data") -> None:
+                             candidate_meta: dict, data_dir: str = "data",
+                             compress: bool = False) -> None:
         """Write detailed results to CSV."""
+        with cls.open_writer(race_type, race_id[:4], data_dir, compress) as writer:
+            writer.write_race(race_id, county_results, candidate_meta)
+
+    @classmethod
+    @contextmanager
+    def open_writer(cls, race_type: str, year: Union[int, str], data_dir: str = "data",
+                    compress: bool = False) -> Iterator['DetailedWriter']:
+        """Open one detailed CSV for appending many races of a type.
+
+        The file is opened (and its header written) on the first write_race call,
+        then kept open until the block exits. compress=True writes a .csv.gz.
+        """
         os.makedirs(data_dir, exist_ok=True)
+        ext = '.csv.gz' if compress else '.csv'
+        filename = os.path.join(data_dir, f'{race_type}_detailed_{year}{ext}')
+        writer = DetailedWriter(race_type, filename)
+        try:
+            yield writer
+        finally:
+            writer.close()
 
-        year = race_id[:4]
-        filename = os.path.join(data_dir, f'{race_type}_detailed_{year}.csv')
-        
-        # Prepare rows for writing
-        rows = []
-        for county_result in county_results:
-            base_row = {
-                'race_id': race_id,
-                'state_postal': county_result.state_postal,
-                'county_name': county_result.county_name,
-                'county_fips': county_result.county_fips,
-                'county_id': county_result.county_id,
-                'precincts_reporting': county_result.precincts_reporting,
-                'precincts_total': county_result.precincts_total,
-                'precincts_reporting_pct': county_result.precincts_reporting_pct,
-                'expected_vote_pct': county_result.expected_vote_pct,
-                'total_votes': county_result.total_votes,
-                'registered_voters': county_result.registered_voters,
-                'last_updated': county_result.last_updated.isoformat()
+    @classmethod
+    @contextmanager
+    def open_parquet_writer(cls, race_type: str, year: Union[int, str], data_dir: str = "data") -> Iterator['ParquetDetailedWriter']:
+        """Open the year's detailed Parquet dataset for many races of a type.
+
+        Rows are buffered and written in large batches to the dataset directory
+        data_dir/<race_type>_detailed_<year>/, partitioned by state_postal.
+        """
+        writer = ParquetDetailedWriter(race_type, os.path.join(data_dir, f'{race_type}_detailed_{year}'))
+        try:
+            yield writer
+        finally:
+            writer.close()
+
+    @staticmethod
+    def build_rows(race_type: str, race_id: str, county_results: List[CountyResult],
+                   candidate_meta: dict) -> List[str]:
+        """Build the CSV lines for one race's county results.
+
+        Candidate columns are quoted once per race and county columns once per
+        county, so each (county, candidate) line only formats its vote fields.
+        """
+        if race_type == 'ballot':
+            candidate_fields = {
+                cand_id: f"{_q(cand_id)},{_q(cand.get('last', ''))}"
+                for cand_id, cand in candidate_meta.items()
             }
+        else:
+            candidate_fields = {
+                cand_id: (
+                    f"{_q(cand_id)},{_q(cand.get('first', ''))},"
+                    f"{_q(cand.get('last', ''))},{_q(cand.get('party', ''))}"
+                )
+                for cand_id, cand in candidate_meta.items()
+            }
+
+        race = _q(race_id)
+        lines = []
+        append = lines.append
+        for county_result in county_results:
+            prefix = (
+                f"{race},{_q(county_result.state_postal)},{_q(county_result.county_name)},"
+                f"{_q(county_result.county_fips)},{_q(county_result.county_id)},"
+                f"{_q(county_result.precincts_reporting)},{_q(county_result.precincts_total)},"
+                f"{_q(county_result.precincts_reporting_pct)},{_q(county_result.expected_vote_pct)},"
+                f"{_q(county_result.total_votes)},{_q(county_result.registered_voters)},"
+                f"{county_result.last_updated.isoformat()}"
+            )
             
             for cand_id, vote_data in county_result.candidate_votes.items():
-                if cand_id in candidate_meta:
-                    row = base_row.copy()
-                    cand = candidate_meta[cand_id]
-                    
-                    if race_type == 'ballot':
-                        row.update({
-                            'candidate_id': cand_id,
-                            'option_name': cand.get('last', ''),
-                            'vote_count': vote_data['votes'],
-                            'vote_pct': vote_data['pct']
-                        })
-                        rows.append(row)
-                    else:
-                        row.update({
-                            'candidate_id': cand_id,
-                            'first_name': cand.get('first', ''),
-                            'last_name': cand.get('last', ''),
-                            'party': cand.get('party', ''),
-                            'vote_count': vote_data['votes'],
-                            'vote_pct': vote_data['pct']
-                        })
-                        rows.append(row)
+                fields = candidate_fields.get(cand_id)
+                if fields is not None:
+                    append(f"{prefix},{fields},{_q(vote_data['votes'])},{_q(vote_data['pct'])}\n")
+        return lines
 
+
+class DetailedWriter:
+    """Appends county-level rows for one race type to a single detailed CSV."""
+
+    def __init__(self, race_type: str, filename: str):
+        self.race_type = race_type
+        self.filename = filename
         # Determine which headers to use
-        headers = cls.BALLOT_HEADERS if race_type == 'ballot' else cls.PERSON_RACE_HEADERS
+        if race_type == 'ballot':
+            self.headers = DetailedFormatter.BALLOT_HEADERS
+        else:
+            self.headers = DetailedFormatter.PERSON_RACE_HEADERS
+        self.file: Optional[BinaryIO] = None
 
-        # Write or append to file
-        file_exists = os.path.exists(filename)
-        mode = 'a' if file_exists else 'w'
-        
-        with open(filename, mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
+    def write_race(self, race_id: str, county_results: List[CountyResult], candidate_meta: dict) -> None:
+        """Append one race's county results."""
+        if self.file is None:
+            # Write or append to file; files seen earlier in this run skip the stat
+            known = DetailedFormatter._known_files
+            file_exists = self.filename in known or os.path.exists(self.filename)
+            self.file = _open_output(self.filename, 'ab' if file_exists else 'wb')
             if not file_exists:
-                writer.writeheader()
-                print(f"Created new file: {filename}")
-            writer.writerows(rows)
-            #print(f"{'Appended' if file_exists else 'Wrote'} {len(rows)} rows for race {race_id} to {filename}")
+                self.file.write(','.join(self.headers).encode('utf-8') + b'\n')
+                print(f"Created new file: {self.filename}")
+            known.add(self.filename)
+
+        rows = DetailedFormatter.build_rows(self.race_type, race_id, county_results, candidate_meta)
+        self.file.write(''.join(rows).encode('utf-8'))
+
+    def close(self) -> None:
+        """Flush and close the file, if anything was written."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class ParquetDetailedWriter:
+    """Buffers county-level rows for one race type and writes them to a Parquet dataset.
+
+    Same write_race/close interface and columns as DetailedWriter. Each flush
+    adds new files to the dataset, so repeated runs accumulate like appended
+    CSVs do.
+    """
+
+    # Buffered rows that trigger a write
+    FLUSH_ROWS = 1_000_000
+
+    INTEGER_COLUMNS = frozenset({
+        'precincts_reporting', 'precincts_total', 'total_votes', 'registered_voters', 'vote_count'
+    })
+    FLOAT_COLUMNS = frozenset({'precincts_reporting_pct', 'expected_vote_pct', 'vote_pct'})
+
+    def __init__(self, race_type: str, root_path: str):
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet output")
+        self.race_type = race_type
+        self.root_path = root_path
+        if race_type == 'ballot':
+            headers = DetailedFormatter.BALLOT_HEADERS
+        else:
+            headers = DetailedFormatter.PERSON_RACE_HEADERS
+        self.schema = pa.schema([(name, self.column_type(name)) for name in headers])
+        self.columns: Dict[str, list] = {name: [] for name in self.schema.names}
+        self.row_count = 0
+
+    @classmethod
+    def column_type(cls, name: str):
+        """Arrow type for a detailed CSV column."""
+        if name in cls.INTEGER_COLUMNS:
+            return pa.int64()
+        if name in cls.FLOAT_COLUMNS:
+            return pa.float64()
+        if name == 'last_updated':
+            return pa.timestamp('us', tz='UTC')
+        return pa.string()
+
+    def write_race(self, race_id: str, county_results: List[CountyResult], candidate_meta: dict) -> None:
+        """Buffer one race's county results, writing out once FLUSH_ROWS are held."""
+        columns = self.columns
+        ballot = self.race_type == 'ballot'
+        for county_result in county_results:
+            county_values = (
+                race_id, county_result.state_postal, county_result.county_name,
+                county_result.county_fips, county_result.county_id,
+                county_result.precincts_reporting, county_result.precincts_total,
+                county_result.precincts_reporting_pct, county_result.expected_vote_pct,
+                county_result.total_votes, county_result.registered_voters,
+                county_result.last_updated
+            )
+            for cand_id, vote_data in county_result.candidate_votes.items():
+                cand = candidate_meta.get(cand_id)
+                if cand is None:
+                    continue
+                if ballot:
+                    candidate_values = (cand_id, cand.get('last', ''))
+                else:
+                    candidate_values = (cand_id, cand.get('first', ''), cand.get('last', ''), cand.get('party', ''))
+                values = county_values + candidate_values + (vote_data['votes'], vote_data['pct'])
+                for column, value in zip(columns.values(), values):
+                    column.append(value)
+                self.row_count += 1
+
+        if self.row_count >= self.FLUSH_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as new files in the dataset."""
+        if not self.row_count:
+            return
+        table = pa.Table.from_pydict(self.columns, schema=self.schema)
+        pq.write_to_dataset(
+            table,
+            root_path=self.root_path,
+            partition_cols=['state_postal'],
+            compression='zstd'
+        )
+        for column in self.columns.values():
+            column.clear()
+        self.row_count = 0
+
+    def close(self) -> None:
+        """Write any rows still buffered."""
+        self.flush()
@@ -1,9 +1,13 @@
 import argparse
 import requests
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from tqdm import tqdm
-from parser import ElectionDataParser, DetailedDataParser
+from parser import ElectionDataParser, DetailedDataParser, parse_json, cached_get
 from formatters import ConsoleFormatter, CSVFormatter, DetailedFormatter
 
 # Election day configuration
@@ -27,6 +31,27 @@ ELECTION_DAYS = {
     #1998: {"date": "1998-11-03", "types": ["senate", "governor", "house", "ballot"]},
 }
 
+# Concurrent county-level detail fetches; each one is dominated by network latency
+DETAIL_FETCH_WORKERS = 16
+
+def create_session():
+    """Create the keep-alive session shared by the national and detailed fetches."""
+    session = requests.Session()
+    # Transient connection failures are retried with a short backoff rather
+    # than dropping the race (or the whole year) on the first hiccup
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    return session
+
 def get_base_url(year, date):
     """Construct the base URL for the given election year."""
     if year >= 2024:
@@ -42,18 +67,31 @@ def ensure_year_directory(base_dir, year):
     os.makedirs(year_dir, exist_ok=True)
     return year_dir
 
-def fetch_election_data(base_url, year):
+def is_election_day(year):
+    """Whether today is the given year's election day, i.e. results are live."""
+    return ELECTION_DAYS[year]['date'] == datetime.now().date().isoformat()
+
+def fetch_election_data(base_url, year, session, cache_dir=None):
     """Fetch election data from AP endpoints."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         progress_url = f"{base_url}/results/national/progress.json"
         metadata_url = f"{base_url}/results/national/metadata.json"
-        
-        progress_data = requests.get(progress_url, headers=headers, timeout=30).json()
-        metadata = requests.get(metadata_url, headers=headers, timeout=30).json()
+
+        def fetch(url, cached):
+            if cached:
+                return cached_get(session, url, cache_dir)
+            return parse_json(session.get(url, timeout=30))
+
+        # Both documents are requested at once rather than back to back.
+        # Progress changes minute to minute on election day itself, so only
+        # cache it once the count is historical
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            progress_future = pool.submit(
+                fetch, progress_url, cache_dir is not None and not is_election_day(year)
+            )
+            metadata_future = pool.submit(fetch, metadata_url, cache_dir is not None)
+            progress_data = progress_future.result()
+            metadata = metadata_future.result()
         
         return progress_data, metadata
     except Exception as e:
@@ -74,6 +112,112 @@ def validate_year(year):
         
     return True, "Valid election year"
 
+def process_year(year, args, session=None):
+    """Fetch, parse, print and (optionally) save one election year."""
+    if session is None:
+        session = create_session()
+    # Conditional-GET copies of the national JSON documents
+    cache_dir = os.path.join(args.data_dir, '.cache')
+
+    print(f"\nProcessing election year {year}")
+    election_info = ELECTION_DAYS[year]
+
+    try:
+        base_url = get_base_url(year, election_info['date'])
+    except ValueError as e:
+        print(f"Skipping year {year}: {e}")
+        return
+
+    # Fetch data with retries
+    max_attempts = 3 if args.retry_failed else 1
+    attempt = 0
+    progress_data = metadata = None
+
+    while attempt < max_attempts and not (progress_data and metadata):
+        if attempt > 0:
+            print(f"Retry attempt {attempt} for year {year}")
+        progress_data, metadata = fetch_election_data(base_url, year, session, cache_dir)
+        attempt += 1
+
+    if not progress_data or not metadata:
+        print(f"Skipping year {year} due to data fetch error")
+        return
+
+    # Parse results
+    parser = ElectionDataParser()
+    races = parser.parse_results(progress_data, metadata)
+    categorized_races = parser.categorize_races(races)
+
+    # Filter races based on election year type
+    allowed_types = election_info['types']
+    filtered_races = {
+        category: races 
+        for category, races in categorized_races.items()
+        if (category.lower() in allowed_types or 
+            (category == 'Ballot Measures' and 'ballot' in allowed_types))
+    }
+
+    # Show console output
+    print(f"\nResults for {year}:")
+    ConsoleFormatter.write_results(filtered_races)
+
+    # Save to CSV files if requested
+    if args.save:
+        year_dir = ensure_year_directory(args.data_dir, year)
+        print(f"\nSaving {year} results to {year_dir}/")
+
+        CSVFormatter.write_results(filtered_races, year_dir, compress=args.compress)
+
+        # Process detailed data
+        print(f"\nFetching detailed county-level data for {year}...")
+        # County payloads are revalidated against the same disk cache,
+        # except while the count is still live
+        detailed_parser = DetailedDataParser(
+            base_url,
+            session=session,
+            cache_dir=None if is_election_day(year) else cache_dir
+        )
+
+        race_types = [
+            ('president', filtered_races.get('President', [])),
+            ('senate', filtered_races.get('Senate', [])),
+            ('governor', filtered_races.get('Governor', [])),
+            ('ballot', filtered_races.get('Ballot Measures', []))
+        ]
+
+        # Process each race type; fetches run concurrently and results are
+        # written from this thread as they complete
+        for race_type, races in race_types:
+            if races:
+                print(f"\nProcessing {race_type} races...")
+                # One writer (detailed CSV or Parquet dataset) per race type,
+                # shared by all of its races
+                if args.parquet:
+                    detail_sink = DetailedFormatter.open_parquet_writer(race_type, year, year_dir)
+                else:
+                    detail_sink = DetailedFormatter.open_writer(race_type, year, year_dir, args.compress)
+                with detail_sink as writer:
+                    results = detailed_parser.get_detailed_results_many(
+                        ((race.race_id, race.state_postal) for race in races),
+                        max_workers=DETAIL_FETCH_WORKERS
+                    )
+                    # Progress advances as each fetch finishes, and
+                    # redraws at most twice a second
+                    pbar = tqdm(total=len(races), mininterval=0.5,
+                                desc=f"Fetching {race_type} county data")
+                    try:
+                        for race_id, county_results in results:
+                            if county_results:
+                                writer.write_race(
+                                    race_id,
+                                    county_results,
+                                    metadata[race_id]['candidates']
+                                )
+                            pbar.update(1)
+                    finally:
+                        pbar.close()
+                print(f"Completed {race_type} data collection")
+
 def main():
     """Main entry point for the parser."""
     parser = argparse.ArgumentParser(description='Parse and display AP Election results')
@@ -84,6 +228,12 @@ def main():
                        help='Election years to process (default: most recent year)')
     parser.add_argument('--retry-failed', action='store_true',
                        help='Retry failed data fetches up to 3 times')
+    parser.add_argument('--compress', action='store_true',
+                       help='Gzip the saved CSV files (.csv.gz)')
+    parser.add_argument('--parquet', action='store_true',
+                       help='Save county-level detail as a Parquet dataset instead of CSV (needs pyarrow)')
+    parser.add_argument('--parallel-years', action='store_true',
+                       help='Process multiple years concurrently, one process per year')
     args = parser.parse_args()
 
     # Validate requested years
@@ -99,85 +249,17 @@ def main():
         print("No valid election years specified")
         return
 
-    for year in valid_years:
-        print(f"\nProcessing election year {year}")
-        election_info = ELECTION_DAYS[year]
-        
-        try:
-            base_url = get_base_url(year, election_info['date'])
-        except ValueError as e:
-            print(f"Skipping year {year}: {e}")
-            continue
-
-        # Fetch data with retries
-        max_attempts = 3 if args.retry_failed else 1
-        attempt = 0
-        progress_data = metadata = None
-        
-        while attempt < max_attempts and not (progress_data and metadata):
-            if attempt > 0:
-                print(f"Retry attempt {attempt} for year {year}")
-            progress_data, metadata = fetch_election_data(base_url, year)
-            attempt += 1
-
-        if not progress_data or not metadata:
-            print(f"Skipping year {year} due to data fetch error")
-            continue
-
-        # Parse results
-        parser = ElectionDataParser()
-        races = parser.parse_results(progress_data, metadata)
-        categorized_races = parser.categorize_races(races)
-        
-        # Filter races based on election year type
-        allowed_types = election_info['types']
-        filtered_races = {
-            category: races 
-            for category, races in categorized_races.items()
-            if (category.lower() in allowed_types or 
-                (category == 'Ballot Measures' and 'ballot' in allowed_types))
-        }
-
-        # Show console output
-        print(f"\nResults for {year}:")
-        ConsoleFormatter.write_results(filtered_races)
-
-        # Save to CSV files if requested
-        if args.save:
-            year_dir = ensure_year_directory(args.data_dir, year)
-            print(f"\nSaving {year} results to {year_dir}/")
-            
-            CSVFormatter.write_results(filtered_races, year_dir)
-
-            # Process detailed data
-            print(f"\nFetching detailed county-level data for {year}...")
-            detailed_parser = DetailedDataParser(base_url)
-
-            race_types = [
-                ('president', filtered_races.get('President', [])),
-                ('senate', filtered_races.get('Senate', [])),
-                ('governor', filtered_races.get('Governor', [])),
-                ('ballot', filtered_races.get('Ballot Measures', []))
-            ]
-
-            # Process each race type
-            for race_type, races in race_types:
-                if races:
-                    print(f"\nProcessing {race_type} races...")
-                    for race in tqdm(races, desc=f"Fetching {race_type} county data"):
-                        county_results = detailed_parser.get_detailed_results(
-                            race.race_id,
-                            race.state_postal
-                        )
-                        if county_results:
-                            DetailedFormatter.write_detailed_results(
-                                race_type,
-                                race.race_id,
-                                county_results,
-                                metadata[race.race_id]['candidates'],
-                                year_dir
-                            )
-                    print(f"Completed {race_type} data collection")
+    if args.parallel_years and len(valid_years) > 1:
+        # Years are independent end to end; each worker process builds its
+        # own session, since pooled connections must not cross a fork
+        workers = min(len(valid_years), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(partial(process_year, args=args), valid_years))
+    else:
+        # One connection pool for every request in the run
+        session = create_session()
+        for year in valid_years:
+            process_year(year, args, session)
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,16 @@
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Optional, Dict
 from datetime import datetime
 
-@dataclass
+# Category name for each regular-race office ID; anything else is 'Other'
+OFFICE_CATEGORIES = {
+    'P': 'President',
+    'S': 'Senate',
+    'H': 'House',
+    'G': 'Governor'
+}
+
+@dataclass(slots=True)
 class PersonCandidate:
     """Candidate that is a person (not a ballot option)."""
     candidate_id: str
@@ -15,8 +23,13 @@ class PersonCandidate:
     incumbent: bool = False
     advance_total: Optional[int] = None
     color_index: Optional[int] = None
+    # "First Last", built once so repeated renders don't rejoin the names
+    display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.display_name = f"{self.first_name} {self.last_name}"
 
-@dataclass
+@dataclass(slots=True)
 class BallotOptionCandidate:
     """Candidate that is a ballot option (e.g., Yes/No)."""
     candidate_id: str
@@ -28,7 +41,7 @@ class BallotOptionCandidate:
     advance_total: Optional[int] = None
     color_index: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class ElectionRace:
     """Regular election race."""
     race_id: str
@@ -50,8 +63,13 @@ class ElectionRace:
     seat_name: Optional[str] = None
     seat_num: Optional[str] = None
     incumbent_id: Optional[str] = None
+
+    @property
+    def category_key(self) -> str:
+        """Category the race is grouped under, from its office ID."""
+        return OFFICE_CATEGORIES.get(self.office_id.upper(), 'Other')
     
-@dataclass
+@dataclass(slots=True)
 class BallotMeasure:
     """Ballot measure race."""
     race_id: str
@@ -73,8 +91,9 @@ class BallotMeasure:
     designation: str
     candidates: List[BallotOptionCandidate]
     key_race: bool = False
+    category_key: ClassVar[str] = 'Ballot Measures'
 
-@dataclass
+@dataclass(slots=True)
 class CountyResult:
     """Represents county-level election results."""
     state_postal: str
@@ -1,27 +1,155 @@
-from typing import Dict, List, Union, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple, Union, Optional
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import hashlib
+import json
+import os
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from models import PersonCandidate, BallotOptionCandidate, ElectionRace, BallotMeasure, CountyResult
 
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to requests' stdlib JSON decoding
+    orjson = None
+try:
+    import ijson
+except ImportError:  # Optional; get_detailed_results falls back to a full decode
+    ijson = None
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def decode_json(content: bytes) -> Any:
+    """Decode raw JSON bytes (e.g. a cached response body)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _json_fingerprint(data: Any) -> int:
+    """Hash of a JSON document's serialized form (equal for equal documents in the same key order)."""
+    if orjson is not None:
+        return hash(orjson.dumps(data))
+    return hash(json.dumps(data, separators=(',', ':')))
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """Write a file through a temporary copy, so a killed run never leaves it truncated."""
+    with open(path + '.tmp', 'wb') as f:
+        f.write(content)
+    os.replace(path + '.tmp', path)
+
+def _read_validators(meta_path: str) -> Optional[dict]:
+    """The cached ETag/Last-Modified validators, or None if they're missing or unreadable."""
+    try:
+        with open(meta_path, 'rb') as f:
+            validators = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return validators if isinstance(validators, dict) else None
+
+def cached_get(session: requests.Session, url: str, cache_dir: str) -> Any:
+    """GET a JSON document, revalidating a copy cached under cache_dir.
+
+    The body is stored alongside its ETag/Last-Modified validators; when the
+    server answers 304 Not Modified the cached body is decoded instead. A
+    cached copy that can't be read is treated as a miss and fetched again.
+    """
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    body_path = os.path.join(cache_dir, f"{key}.json")
+    meta_path = os.path.join(cache_dir, f"{key}.meta.json")
+
+    headers = {}
+    validators = _read_validators(meta_path) if os.path.exists(body_path) else None
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    response = session.get(url, headers=headers, timeout=30)
+    if response.status_code == 304:
+        try:
+            with open(body_path, 'rb') as f:
+                return decode_json(f.read())
+        except (OSError, ValueError):
+            response = session.get(url, timeout=30)
+    response.raise_for_status()
+    data = parse_json(response)
+
+    validators = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }
+    if validators['etag'] or validators['last_modified']:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Body first, so validators never describe a body that isn't there
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(validators).encode('utf-8'))
+
+    return data
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp; AP stamps whole batches of races and counties identically."""
+    return datetime.fromisoformat(timestamp)
+
+def _intern(value: Any) -> Any:
+    """sys.intern a string; anything else (e.g. a JSON null) passes through unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class ElectionDataParser:
     """Parser that combines progress and metadata information."""
     
-    BALLOT_MEASURE_KEYWORDS = {
+    BALLOT_MEASURE_KEYWORDS = frozenset({
         'Amendment', 'Issue', 'Question', 'Measure', 'Proposition', 'Prop'
-    }
+    })
+
+    # Long-running pollers can set this so races that haven't changed since
+    # the previous parse in this process are reused instead of rebuilt. A
+    # race counts as unchanged while its progress lastUpdated stays the same
+    # and its metadata (call status, key race flag, vote block, candidates)
+    # serializes identically; it's off by default since a single pass gains
+    # nothing.
+    REUSE_UNCHANGED_RACES = False
+
+    # race_id -> ((lastUpdated, metadata fingerprint), parsed race); one
+    # entry per race, replaced whenever the race changes
+    _race_cache: Dict[str, Tuple[Tuple[Any, int], Union[ElectionRace, BallotMeasure]]] = {}
     
     @staticmethod
-    def get_vote_info(data: dict, field: str, default: int = 0) -> int:
+    def vote_block(data: dict) -> dict:
+        """The 'vote' mapping of progress or metadata ({} when there is none).
+
+        It's read from data['parameters']['vote'], falling back to data['vote'].
+        """
+        parameters = data.get('parameters')
+        vote = parameters.get('vote') if type(parameters) is dict else None
+        if vote is None:
+            vote = data.get('vote')
+        return vote if type(vote) is dict else {}
+
+    @classmethod
+    def get_vote_info(cls, data: dict, field: str, default: int = 0) -> int:
         """Safely extract vote information from either progress or metadata."""
-        try:
-            return data['parameters']['vote'].get(field, default)
-        except (KeyError, TypeError):
-            try:
-                return data['vote'].get(field, default)
-            except (KeyError, TypeError):
-                return default
+        return cls.vote_block(data).get(field, default)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def office_has_measure_keyword(cls, office_name: str) -> bool:
+        """Check an office name for ballot-measure terms; many races share one."""
+        return not cls.BALLOT_MEASURE_KEYWORDS.isdisjoint(office_name.split())
 
     @classmethod
     def is_ballot_measure(cls, race_meta: dict) -> bool:
@@ -29,81 +157,105 @@ class ElectionDataParser:
         if race_meta.get('suppOfficeID') == 'IME':
             return True
         
-        office_name = race_meta.get('officeName', '').split()
-        if any(term in cls.BALLOT_MEASURE_KEYWORDS for term in office_name):
+        if cls.office_has_measure_keyword(race_meta.get('officeName', '')):
             return True
         
-        candidates = race_meta.get('candidates', {}).values()
-        candidate_names = {c.get('last', '').lower() for c in candidates}
-        if {'yes', 'no'}.issubset(candidate_names) or {'for', 'against'}.issubset(candidate_names):
-            return True
+        # Yes/No or For/Against option pairs, stopping as soon as one is complete
+        yes = no = for_ = against = False
+        for c in race_meta.get('candidates', {}).values():
+            last = c.get('last', '')
+            if not last:
+                continue
+            last = last.lower()
+            if last == 'yes':
+                yes = True
+            elif last == 'no':
+                no = True
+            elif last == 'for':
+                for_ = True
+            elif last == 'against':
+                against = True
+            else:
+                continue
+            if (yes and no) or (for_ and against):
+                return True
         
         return False
 
-    @staticmethod
-    def parse_candidate(prog_data: dict, meta_data: dict) -> Union[PersonCandidate, BallotOptionCandidate]:
+    @classmethod
+    def parse_candidate(cls, prog_data: dict, meta_data: dict) -> Union[PersonCandidate, BallotOptionCandidate]:
         """Parse candidate data from progress and metadata."""
-        cand_id = prog_data['candidateID']
-        meta_cand = meta_data['candidates'][cand_id]
-        
-        # Handle missing vote data
-        vote_count = prog_data.get('voteCount', 0)
-        vote_pct = prog_data.get('votePct', 0.0)
+        return cls.parse_candidates([prog_data], meta_data)[0]
+
+    @staticmethod
+    def parse_candidates(prog_candidates: List[dict], meta_data: dict) -> List[Union[PersonCandidate, BallotOptionCandidate]]:
+        """Parse every candidate of a race from progress and metadata."""
+        meta_candidates = meta_data['candidates']
+        person, option = PersonCandidate, BallotOptionCandidate
+        intern = _intern
+        candidates = []
+        append = candidates.append
         
-        base_args = {
-            'candidate_id': cand_id,
-            'party': meta_cand.get('party', 'Unknown'),  # Handle missing party
-            'ballot_order': meta_cand.get('ballotOrder', 0),  # Handle missing ballot order
-            'vote_count': vote_count,
-            'vote_pct': vote_pct,
-            'advance_total': prog_data.get('advanceTotal'),
-            'color_index': prog_data.get('colorIndex')
-        }
+        for prog_cand in prog_candidates:
+            # IDs and parties repeat across every race and poll; interned,
+            # each distinct value is stored once
+            cand_id = intern(prog_cand['candidateID'])
+            meta_cand = meta_candidates[cand_id]
+            get = prog_cand.get
+            party = intern(meta_cand.get('party', 'Unknown'))
+            
+            # Determine if this is a ballot option or person; missing party,
+            # ballot order, names and vote data fall back to defaults
+            if 'first' in meta_cand:
+                append(person(
+                    cand_id,
+                    party,
+                    meta_cand.get('ballotOrder', 0),
+                    get('voteCount', 0),
+                    get('votePct', 0.0),
+                    meta_cand.get('first', ''),
+                    meta_cand.get('last', ''),
+                    meta_cand.get('incumbent', False),
+                    get('advanceTotal'),
+                    get('colorIndex')
+                ))
+            else:
+                append(option(
+                    cand_id,
+                    party,
+                    meta_cand.get('ballotOrder', 0),
+                    get('voteCount', 0),
+                    get('votePct', 0.0),
+                    meta_cand.get('last', ''),
+                    get('advanceTotal'),
+                    get('colorIndex')
+                ))
         
-        # Determine if this is a ballot option or person
-        if 'first' in meta_cand:
-            return PersonCandidate(
-                first_name=meta_cand.get('first', ''),  # Handle missing first name
-                last_name=meta_cand.get('last', ''),    # Handle missing last name
-                incumbent=meta_cand.get('incumbent', False),
-                **base_args
-            )
-        else:
-            return BallotOptionCandidate(
-                option_name=meta_cand.get('last', ''),  # Handle missing option name
-                **base_args
-            )
+        return candidates
 
     @classmethod
     def parse_race(cls, race_id: str, prog_data: dict, meta_data: dict) -> Union[ElectionRace, BallotMeasure]:
         """Parse race data from progress and metadata."""
         # Get vote information
-        total_votes = cls.get_vote_info(meta_data, 'total', 0)
-        registered_voters = cls.get_vote_info(meta_data, 'registered', 0)
+        vote = cls.vote_block(meta_data)
+        total_votes = vote.get('total', 0)
+        registered_voters = vote.get('registered', 0)
         
-        # Common attributes for all race types
-        base_args = {
-            'race_id': race_id,
-            'state_postal': prog_data['statePostal'],
-            'state_name': prog_data['stateName'],
-            'race_type': meta_data['raceType'],
-            'race_call_status': meta_data.get('raceCallStatus', 'Unknown'),
-            'office_name': meta_data['officeName'],
-            'last_updated': datetime.fromisoformat(prog_data['lastUpdated']),
-            'precincts_reporting': prog_data['precinctsReporting'],
-            'precincts_total': prog_data['precinctsTotal'],
-            'precincts_reporting_pct': prog_data['precinctsReportingPct'],
-            'expected_vote_pct': prog_data.get('eevp', prog_data.get('expectedVotePct', 0)),
-            'total_votes': total_votes,
-            'registered_voters': registered_voters,
-            'key_race': meta_data.get('keyRace', False)
-        }
+        # Common attributes for all race types, passed positionally below
+        state_postal = _intern(prog_data['statePostal'])
+        state_name = prog_data['stateName']
+        race_type = meta_data['raceType']
+        race_call_status = meta_data.get('raceCallStatus', 'Unknown')
+        office_name = meta_data['officeName']
+        last_updated = _parse_iso(prog_data['lastUpdated'])
+        precincts_reporting = prog_data['precinctsReporting']
+        precincts_total = prog_data['precinctsTotal']
+        precincts_reporting_pct = prog_data['precinctsReportingPct']
+        expected_vote_pct = prog_data.get('eevp', prog_data.get('expectedVotePct', 0))
+        key_race = meta_data.get('keyRace', False)
         
         # Parse all candidates for this race
-        candidates = [
-            cls.parse_candidate(pc, meta_data)
-            for pc in prog_data['candidates']
-        ]
+        candidates = cls.parse_candidates(prog_data['candidates'], meta_data)
         
         # First check if it's a ballot measure
         is_ballot = cls.is_ballot_measure(meta_data)
@@ -123,7 +275,7 @@ class ElectionDataParser:
                         ballot_order=candidate.ballot_order,
                         vote_count=candidate.vote_count,
                         vote_pct=candidate.vote_pct,
-                        option_name=f"{candidate.first_name} {candidate.last_name}".strip(),
+                        option_name=candidate.display_name.strip(),
                         advance_total=candidate.advance_total,
                         color_index=candidate.color_index
                     ))
@@ -131,91 +283,134 @@ class ElectionDataParser:
                     ballot_options.append(candidate)
             
             return BallotMeasure(
-                description=meta_data.get('description', meta_data['officeName']),
-                category=meta_data.get('category', 'Uncategorized'),
-                summary=meta_data.get('summary', ''),
-                designation=meta_data.get('designation', ''),
-                candidates=ballot_options,
-                **base_args
+                race_id, state_postal, state_name, race_type, race_call_status,
+                office_name, last_updated,
+                precincts_reporting, precincts_total, precincts_reporting_pct,
+                expected_vote_pct, total_votes, registered_voters,
+                meta_data.get('description', office_name),
+                meta_data.get('category', 'Uncategorized'),
+                meta_data.get('summary', ''),
+                meta_data.get('designation', ''),
+                ballot_options,
+                key_race
             )
         else:
             return ElectionRace(
-                office_id=meta_data['officeID'],
-                candidates=candidates,
-                seat_name=meta_data.get('seatName'),
-                seat_num=meta_data.get('seatNum'),
-                incumbent_id=meta_data.get('incumbentID'),
-                **base_args
+                race_id, state_postal, state_name, race_type, race_call_status,
+                office_name, meta_data['officeID'], last_updated,
+                precincts_reporting, precincts_total, precincts_reporting_pct,
+                expected_vote_pct, total_votes, registered_voters,
+                candidates,
+                key_race,
+                meta_data.get('seatName'),
+                meta_data.get('seatNum'),
+                meta_data.get('incumbentID')
             )
 
     @classmethod
     def parse_results(cls, progress_data: dict, metadata: dict) -> Dict[str, Union[ElectionRace, BallotMeasure]]:
         """Parse all races from progress and metadata."""
-        races = {}
-        
-        for race_id in progress_data:
-            if race_id in metadata:
+        # Races keep progress order (the CSV and console order), with one
+        # metadata lookup per race
+        return dict(cls.parse_entries(
+            (race_id, prog_data, race_meta)
+            for race_id, prog_data in progress_data.items()
+            if (race_meta := metadata.get(race_id)) is not None
+        ))
+
+    @classmethod
+    def iter_races(cls, progress_data: dict, metadata_items: Iterable[Tuple[str, dict]]) -> Iterator[Tuple[str, Union[ElectionRace, BallotMeasure]]]:
+        """Lazily parse races as (race_id, metadata) pairs arrive.
+
+        metadata_items only has to be iterable, so it can come straight off a
+        streaming JSON decoder (e.g. ``ijson.kvitems(response.raw, '')``)
+        without the whole metadata document being held in memory. Races
+        missing from progress_data are skipped.
+        """
+        return cls.parse_entries(
+            (race_id, prog_data, race_meta)
+            for race_id, race_meta in metadata_items
+            if (prog_data := progress_data.get(race_id)) is not None
+        )
+
+    @classmethod
+    def parse_entries(cls, entries: Iterable[Tuple[str, dict, dict]]) -> Iterator[Tuple[str, Union[ElectionRace, BallotMeasure]]]:
+        """Parse (race_id, progress, metadata) entries, reporting and skipping bad races."""
+        parse_race = cls.parse_race
+        race_cache = cls._race_cache
+        reuse = cls.REUSE_UNCHANGED_RACES
+        for race_id, prog_data, race_meta in entries:
+            race = None
+            if reuse:
+                # Reuse the last race built for this ID if nothing changed
+                version = (prog_data.get('lastUpdated'), _json_fingerprint(race_meta))
+                cached = race_cache.get(race_id)
+                if cached is not None and cached[0] == version:
+                    race = cached[1]
+            
+            if race is None:
                 try:
-                    races[race_id] = cls.parse_race(
-                        race_id,
-                        progress_data[race_id],
-                        metadata[race_id]
-                    )
+                    race = parse_race(race_id, prog_data, race_meta)
                 except Exception as e:
                     print(f"Error parsing race {race_id}: {str(e)}")
                     # Log additional debug information
-                    print(f"Progress data keys: {progress_data[race_id].keys()}")
-                    print(f"Metadata keys: {metadata[race_id].keys()}")
+                    print(f"Progress data keys: {prog_data.keys()}")
+                    print(f"Metadata keys: {race_meta.keys()}")
                     continue
-        
-        return races
+                if reuse:
+                    race_cache[race_id] = (version, race)
+            yield race_id, race
 
     @staticmethod
     def categorize_races(races: Dict[str, Union[ElectionRace, BallotMeasure]]) -> Dict[str, List[Union[ElectionRace, BallotMeasure]]]:
         """Group races by category."""
-        categories = defaultdict(list)
+        categories: Dict[str, List[Union[ElectionRace, BallotMeasure]]] = defaultdict(list)
         
+        # Each race model knows its own category
         for race in races.values():
-            if isinstance(race, BallotMeasure):
-                categories['Ballot Measures'].append(race)
-            else:
-                # Handle potentially missing or different office IDs
-                office_id = getattr(race, 'office_id', '').upper()
-                if office_id == 'P':
-                    categories['President'].append(race)
-                elif office_id == 'S':
-                    categories['Senate'].append(race)
-                elif office_id == 'H':
-                    categories['House'].append(race)
-                elif office_id == 'G':
-                    categories['Governor'].append(race)
-                else:
-                    categories['Other'].append(race)
+            categories[race.category_key].append(race)
         
         return categories
     
 class DetailedDataParser:
     """Parser for county-level election data."""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None, pool_size: int = 32,
+                 cache_dir: Optional[str] = None) -> None:
         self.base_url = base_url
-        self.session = requests.Session()
+        # When set, detail payloads are revalidated with cached_get
+        self.cache_dir = cache_dir
+        if session is None:
+            # Shared by concurrent detail fetches, so the pool must hold a
+            # connection per worker for them to be reused rather than reopened
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=pool_size,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
 
     def fetch_detailed_data(self, state: str, race_id: str) -> Optional[dict]:
         """Fetch detailed data for a specific race."""
         url = f"{self.base_url}/results/races/{state}/{race_id}/detail.json"
         try:
-            response = self.session.get(url)
+            if self.cache_dir is not None:
+                return cached_get(self.session, url, self.cache_dir)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except Exception as e:
             print(f"Error fetching detailed data for {state}/{race_id}: {e}")
             return None
 
     def parse_county_result(self, county_data: dict) -> CountyResult:
         """Parse county-level result data."""
+        intern = _intern
         candidate_votes = {
-            c['candidateID']: {
+            intern(c['candidateID']): {
                 'votes': c['voteCount'],
                 'pct': c['votePct']
             }
@@ -238,7 +433,7 @@ class DetailedDataParser:
             registered_voters = 0  # National registered voter count not provided
 
         return CountyResult(
-            state_postal=county_data['statePostal'],
+            state_postal=intern(county_data['statePostal']),
             county_name=county_data['reportingunitName'],
             county_fips=county_data['fipsCode'],
             county_id=county_data['reportingunitID'],
@@ -248,17 +443,112 @@ class DetailedDataParser:
             expected_vote_pct=county_data.get('eevp', county_data.get('expectedVotePct', 0)),
             total_votes=total_votes,
             registered_voters=registered_voters,
-            last_updated=datetime.fromisoformat(county_data['lastUpdated']),
+            last_updated=_parse_iso(county_data['lastUpdated']),
             candidate_votes=candidate_votes
         )
 
+    @staticmethod
+    def parse_race_county_matrix(detailed_data: dict) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """Lay a race's county results out as (county x candidate) arrays.
+
+        Returns (county_ids, candidate_ids, votes, pct): row i of votes/pct is
+        county_ids[i] and column j is candidate_ids[j], in first-seen order.
+        Candidates missing from a county count as 0. Aggregates such as
+        votes.sum(axis=0) or votes.argmax(axis=1) then run in NumPy.
+        """
+        import numpy as np  # Only needed here; keeps the CLI's startup light
+        counties = list(detailed_data.values())
+        candidate_index: Dict[str, int] = {}
+        for county_data in counties:
+            for c in county_data['candidates']:
+                candidate_index.setdefault(c['candidateID'], len(candidate_index))
+
+        votes = np.zeros((len(counties), len(candidate_index)), dtype=np.int64)
+        pct = np.zeros((len(counties), len(candidate_index)), dtype=np.float64)
+        for i, county_data in enumerate(counties):
+            vote_row, pct_row = votes[i], pct[i]
+            for c in county_data['candidates']:
+                j = candidate_index[c['candidateID']]
+                vote_row[j] = c['voteCount']
+                pct_row[j] = c['votePct']
+
+        county_ids = np.array([county_data.get('reportingunitID', "NA") for county_data in counties], dtype=str)
+        candidate_ids = np.array(list(candidate_index), dtype=str)
+        return county_ids, candidate_ids, votes, pct
+
+    @staticmethod
+    def parse_all_counties(detailed_data: dict):
+        """Flatten a race's county results into one long pandas DataFrame.
+
+        One row per (county_id, candidate_id) with votes and pct columns, built
+        in a single DataFrame construction. A wide votes table is then
+        ``df.pivot(index='county_id', columns='candidate_id', values='votes')``.
+        """
+        import pandas as pd  # Only needed here; keeps the CLI's startup light
+        records = [
+            (county_data.get('reportingunitID', "NA"), c['candidateID'], c['voteCount'], c['votePct'])
+            for county_data in detailed_data.values()
+            for c in county_data['candidates']
+        ]
+        df = pd.DataFrame.from_records(records, columns=['county_id', 'candidate_id', 'votes', 'pct'])
+        return df.astype({'votes': 'int64', 'pct': 'float64'})
+
     def get_detailed_results(self, race_id: str, state: str) -> List[CountyResult]:
-        """Get all county results for a race."""
+        """Get all county results for a race ([] if they can't be fetched)."""
+        if ijson is not None and self.cache_dir is None:
+            # Counties are parsed straight off the response stream, so the
+            # whole payload is never decoded into one dict first
+            try:
+                return list(self.iter_detailed_results(race_id, state))
+            except Exception as e:
+                print(f"Error fetching detailed data for {state}/{race_id}: {e}")
+                return []
+
         detailed_data = self.fetch_detailed_data(state, race_id)
         if not detailed_data:
             return []
             
+        parse_county_result = self.parse_county_result
         return [
-            self.parse_county_result(county_data)
+            parse_county_result(county_data)
             for county_data in detailed_data.values()
         ]
+
+    def iter_detailed_results(self, race_id: str, state: str) -> Iterator[CountyResult]:
+        """Yield a race's county results as they're decoded off the response.
+
+        Needs ijson. Only one county's JSON is held at a time, and fetch or
+        decode errors are raised, including partway through the payload, so
+        a cut-off response never passes for a complete one.
+        """
+        if ijson is None:
+            raise ImportError("ijson is required to stream detail payloads")
+
+        url = f"{self.base_url}/results/races/{state}/{race_id}/detail.json"
+        parse_county_result = self.parse_county_result
+        with self.session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding
+            response.raw.decode_content = True
+            for _, county_data in ijson.kvitems(response.raw, '', use_float=True):
+                yield parse_county_result(county_data)
+
+    def get_detailed_results_many(self, races: Iterable[Tuple[str, str]],
+                                  max_workers: int = 16) -> Iterator[Tuple[str, List[CountyResult]]]:
+        """Get county results for many (race_id, state) pairs concurrently.
+
+        Fetching and parsing run on a thread pool sharing self.session, and
+        (race_id, county results) pairs are yielded as each race finishes, not
+        in input order. Races still pending when the caller stops are cancelled.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.get_detailed_results, race_id, state): race_id
+                for race_id, state in races
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
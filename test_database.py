@@ -0,0 +1,93 @@
+"""Checks that every CSV load path stores the same values."""
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import database
+from database import ElectionDatabase
+
+# A few rows covering the awkward cases: a leading-zero FIPS code, missing
+# county identifiers, empty seat columns and an empty incumbent flag
+HOUSE_CSV = """\
+race_id,state_postal,state_name,office_id,seat_name,seat_num,race_call_status,last_updated,precincts_reporting,precincts_total,precincts_reporting_pct,expected_vote_pct,total_votes,candidate_id,first_name,last_name,party,incumbent,vote_count,vote_pct
+20241105AK0001,AK,Alaska,H,,,Called,2024-11-06T05:00:00+00:00,441,441,100.0,,279065,6022,Mary,Peltola,Dem,True,128435,46.02
+20241105AK0001,AK,Alaska,H,,,Called,2024-11-06T05:00:00+00:00,441,441,100.0,,279065,6023,Nick,Begich,GOP,,150630,53.98
+20241105TX0002,TX,Texas,H,District 2,2,Unknown,2024-11-06T05:00:00+00:00,10,12,83.3,95.5,1000,7001,Ann,"Lee, Jr.",Dem,False,600,60.0
+"""
+
+COUNTY_CSV = """\
+race_id,state_postal,county_name,county_fips,county_id,precincts_reporting,precincts_total,precincts_reporting_pct,expected_vote_pct,total_votes,registered_voters,last_updated,candidate_id,first_name,last_name,option_name,party,vote_count,vote_pct
+20241105AK0001,AK,,,,441,441,100.0,100.0,279065,0,2024-11-06T05:00:00+00:00,6022,Mary,Peltola,,Dem,128435,46.02
+20241105AL0003,AL,Autauga,01001,1001,5,5,100.0,,2000,9000,2024-11-06T05:00:00+00:00,8001,Bo,Smith,,GOP,1500,75.0
+20241105AK0004,AK,Juneau,02000,2000,3,4,75.0,80.0,500,,2024-11-06T05:00:00+00:00,9001,,,Yes,,300,60.0
+"""
+
+TABLES = ('house_races', 'county_results')
+
+
+class LoadPathTest(unittest.TestCase):
+    """Load the same CSVs through each reader and compare the stored rows."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        year_dir = self.tmp / 'data' / '2024'
+        year_dir.mkdir(parents=True)
+        self.files = [year_dir / 'house_2024.csv', year_dir / 'house_detailed_2024.csv']
+        self.files[0].write_text(HOUSE_CSV, encoding='utf-8')
+        self.files[1].write_text(COUNTY_CSV, encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def load(self, name, fast_import=False):
+        """Load the fixture into a fresh database and return each table's rows with their types."""
+        db = ElectionDatabase(str(self.tmp / f'{name}.db'))
+        if fast_import:
+            db.FAST_IMPORT_MIN_ROWS = 0
+        try:
+            with redirect_stdout(StringIO()):
+                for path in self.files:
+                    if fast_import:
+                        self.assertTrue(db.can_fast_import(str(path), db.table_for_file(path)))
+                    db.load_csv_file(str(path), 2024)
+            tables = {}
+            for table in TABLES:
+                columns = [row['name'] for row in db.conn.execute(f"PRAGMA table_info({table})")]
+                select_list = ', '.join(f"{col}, typeof({col})" for col in columns)
+                tables[table] = [
+                    tuple(row) for row in
+                    db.conn.execute(f"SELECT {select_list} FROM {table} ORDER BY {', '.join(columns)}")
+                ]
+            return tables
+        finally:
+            db.close()
+
+    def load_pandas(self):
+        with mock.patch.object(database, 'pa_csv', None):
+            return self.load('pandas')
+
+    def test_pandas_keeps_text_columns_as_text(self):
+        tables = self.load_pandas()
+        row = tables['county_results'][-1]
+        # county_name, county_fips and county_id, each followed by its type
+        self.assertEqual(row[4:10], ('Autauga', 'text', '01001', 'text', '1001', 'text'))
+        house = tables['house_races'][0]
+        # seat_name and seat_num of the at-large Alaska seat stay NULL
+        self.assertEqual(house[8:12], (None, 'null', None, 'null'))
+
+    @unittest.skipIf(database.pa_csv is None, "pyarrow is not installed")
+    def test_arrow_matches_pandas(self):
+        self.assertEqual(self.load('arrow'), self.load_pandas())
+
+    @unittest.skipIf(shutil.which('sqlite3') is None, "sqlite3 shell is not installed")
+    def test_fast_import_matches_pandas(self):
+        self.assertEqual(self.load('fast', fast_import=True), self.load_pandas())
+
+
+if __name__ == '__main__':
+    unittest.main()
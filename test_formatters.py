@@ -0,0 +1,165 @@
+"""Checks that the CSV writers produce the same bytes as the csv module."""
+import csv
+import gzip
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+
+from formatters import CSVFormatter, DetailedFormatter
+from models import BallotMeasure, BallotOptionCandidate, CountyResult, ElectionRace, PersonCandidate
+
+UPDATED = datetime(2024, 11, 6, 5, 0, tzinfo=timezone.utc)
+
+
+def expected_csv(headers, rows) -> bytes:
+    """The header and rows as csv.writer renders them, one LF-terminated line each."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(headers)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def house_race() -> ElectionRace:
+    # An at-large seat (no seat name or number) with awkward candidate names
+    return ElectionRace(
+        race_id='20241105AK0001', state_postal='AK', state_name='Alaska', race_type='G',
+        race_call_status='Called', office_name='U.S. House', office_id='H', last_updated=UPDATED,
+        precincts_reporting=441, precincts_total=441, precincts_reporting_pct=100.0,
+        expected_vote_pct=None, total_votes=279065, registered_voters=0,
+        candidates=[
+            PersonCandidate(candidate_id='6022', party='Dem', ballot_order=1, vote_count=128435,
+                            vote_pct=46.02, first_name='Mary', last_name='Peltola, Jr.', incumbent=True),
+            PersonCandidate(candidate_id='6023', party='GOP', ballot_order=2, vote_count=150630,
+                            vote_pct=53.98, first_name='Nick "Nicky"', last_name='Begich'),
+        ]
+    )
+
+
+def ballot_measure() -> BallotMeasure:
+    return BallotMeasure(
+        race_id='20241105FL0004', state_postal='FL', state_name='Florida', race_type='G',
+        race_call_status='Unknown', office_name='Amendment 4', last_updated=UPDATED,
+        precincts_reporting=10, precincts_total=12, precincts_reporting_pct=83.3,
+        expected_vote_pct=95.5, total_votes=1000, registered_voters=5000,
+        description='Amendment 4, "Abortion"', category='Abortion',
+        summary='Limits government\ninterference', designation='4',
+        candidates=[
+            BallotOptionCandidate(candidate_id='9001', party='', ballot_order=1, vote_count=600,
+                                  vote_pct=60.0, option_name='Yes, approve'),
+            BallotOptionCandidate(candidate_id='9002', party='', ballot_order=2, vote_count=400,
+                                  vote_pct=40.0, option_name='No'),
+        ]
+    )
+
+
+def county_result(candidate_votes) -> CountyResult:
+    return CountyResult(
+        state_postal='MD', county_name="Queen Anne's, \"Upper\"", county_fips='24035',
+        county_id='24035', precincts_reporting=3, precincts_total=4, precincts_reporting_pct=75.0,
+        expected_vote_pct=None, total_votes=500, registered_voters=None, last_updated=UPDATED,
+        candidate_votes=candidate_votes
+    )
+
+
+class CSVOutputTest(unittest.TestCase):
+    """Write awkward races through each writer and compare with csv.writer."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_results(self, compress=False):
+        races = {'House': [house_race()], 'Ballot Measures': [ballot_measure()]}
+        with redirect_stdout(io.StringIO()):
+            CSVFormatter.write_results(races, str(self.tmp), compress=compress)
+
+    def race_rows(self):
+        house, measure = house_race(), ballot_measure()
+        house_rows = [
+            [house.race_id, house.state_postal, house.state_name, house.office_id, house.seat_name,
+             house.seat_num, house.race_call_status, house.last_updated.isoformat(),
+             house.precincts_reporting, house.precincts_total, house.precincts_reporting_pct,
+             house.expected_vote_pct, house.total_votes, c.candidate_id, c.first_name, c.last_name,
+             c.party, c.incumbent, c.vote_count, c.vote_pct]
+            for c in house.candidates
+        ]
+        ballot_rows = [
+            [measure.race_id, measure.state_postal, measure.state_name, measure.description,
+             measure.category, measure.summary, measure.race_call_status,
+             measure.last_updated.isoformat(), measure.precincts_reporting, measure.precincts_total,
+             measure.precincts_reporting_pct, measure.expected_vote_pct, measure.total_votes,
+             c.candidate_id, c.option_name, c.vote_count, c.vote_pct]
+            for c in measure.candidates
+        ]
+        return house_rows, ballot_rows
+
+    def test_race_csvs_match_csv_writer(self):
+        self.write_results()
+        house_rows, ballot_rows = self.race_rows()
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()), ['ballot_2024.csv', 'house_2024.csv'])
+        self.assertEqual((self.tmp / 'house_2024.csv').read_bytes(),
+                         expected_csv(CSVFormatter.CONGRESS_HEADERS, house_rows))
+        self.assertEqual((self.tmp / 'ballot_2024.csv').read_bytes(),
+                         expected_csv(CSVFormatter.BALLOT_HEADERS, ballot_rows))
+
+    def test_compressed_race_csv_matches(self):
+        self.write_results(compress=True)
+        house_rows, _ = self.race_rows()
+        with gzip.open(self.tmp / 'house_2024.csv.gz', 'rb') as f:
+            self.assertEqual(f.read(), expected_csv(CSVFormatter.CONGRESS_HEADERS, house_rows))
+
+    def test_detailed_csv_matches_csv_writer(self):
+        person_meta = {
+            '6022': {'first': 'Mary', 'last': 'Peltola, Jr.', 'party': 'Dem'},
+            '6023': {'first': 'Nick "Nicky"', 'last': 'Begich'},
+        }
+        ballot_meta = {'9001': {'last': 'Yes\napprove'}}
+        person_county = county_result({
+            '6022': {'votes': 300, 'pct': 60.0},
+            '6023': {'votes': 200, 'pct': 40.0},
+            '9999': {'votes': 0, 'pct': 0.0},  # no metadata, so no row
+        })
+        ballot_county = county_result({'9001': {'votes': 500, 'pct': 100.0}})
+
+        with redirect_stdout(io.StringIO()):
+            # Two races through one writer, then a later writer appending a third
+            with DetailedFormatter.open_writer('house', 2024, str(self.tmp)) as writer:
+                writer.write_race('20241105MD0001', [person_county], person_meta)
+                writer.write_race('20241105MD0002', [person_county], person_meta)
+            with DetailedFormatter.open_writer('house', 2024, str(self.tmp)) as writer:
+                writer.write_race('20241105MD0003', [person_county], person_meta)
+            with DetailedFormatter.open_writer('ballot', 2024, str(self.tmp)) as writer:
+                writer.write_race('20241105MD0004', [ballot_county], ballot_meta)
+
+        def county_fields(race_id, county):
+            return [race_id, county.state_postal, county.county_name, county.county_fips,
+                    county.county_id, county.precincts_reporting, county.precincts_total,
+                    county.precincts_reporting_pct, county.expected_vote_pct, county.total_votes,
+                    county.registered_voters, county.last_updated.isoformat()]
+
+        house_rows = [
+            county_fields(race_id, person_county)
+            + [cand_id, cand.get('first', ''), cand.get('last', ''), cand.get('party', ''),
+               person_county.candidate_votes[cand_id]['votes'],
+               person_county.candidate_votes[cand_id]['pct']]
+            for race_id in ('20241105MD0001', '20241105MD0002', '20241105MD0003')
+            for cand_id, cand in person_meta.items()
+        ]
+        ballot_rows = [
+            county_fields('20241105MD0004', ballot_county) + ['9001', 'Yes\napprove', 500, 100.0]
+        ]
+        self.assertEqual((self.tmp / 'house_detailed_2024.csv').read_bytes(),
+                         expected_csv(DetailedFormatter.PERSON_RACE_HEADERS, house_rows))
+        self.assertEqual((self.tmp / 'ballot_detailed_2024.csv').read_bytes(),
+                         expected_csv(DetailedFormatter.BALLOT_HEADERS, ballot_rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
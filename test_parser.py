@@ -0,0 +1,323 @@
+"""Checks for the national and county-level parsers."""
+import copy
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import requests
+
+import parser
+from parser import DetailedDataParser, ElectionDataParser, cached_get
+
+
+def race_payload(race_id='20241105TX0001', office='U.S. Senate', office_id='S'):
+    """Progress and metadata entries for one two-candidate race."""
+    progress = {
+        'statePostal': race_id[8:10],
+        'stateName': 'Texas',
+        'lastUpdated': '2024-11-06T05:00:00+00:00',
+        'precinctsReporting': 10,
+        'precinctsTotal': 12,
+        'precinctsReportingPct': 83.3,
+        'eevp': 95.5,
+        'candidates': [
+            {'candidateID': '1', 'voteCount': 600, 'votePct': 60.0},
+            {'candidateID': '2', 'voteCount': 400, 'votePct': 40.0},
+        ],
+    }
+    metadata = {
+        'raceType': 'G',
+        'officeName': office,
+        'officeID': office_id,
+        'raceCallStatus': 'Too Early to Call',
+        'keyRace': False,
+        'parameters': {'vote': {'total': 1000, 'registered': 5000}},
+        'candidates': {
+            '1': {'first': 'Ann', 'last': 'Lee', 'party': 'Dem', 'ballotOrder': 1},
+            '2': {'first': 'Bo', 'last': 'Smith', 'party': 'GOP', 'ballotOrder': 2},
+        },
+    }
+    return progress, metadata
+
+
+class ReuseUnchangedRacesTest(unittest.TestCase):
+    """REUSE_UNCHANGED_RACES hands back the previous race only while nothing changed."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(ElectionDataParser, 'REUSE_UNCHANGED_RACES', True),
+            mock.patch.object(ElectionDataParser, '_race_cache', {}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        progress, metadata = race_payload()
+        self.progress = {'20241105TX0001': progress}
+        self.metadata = {'20241105TX0001': metadata}
+
+    def parse(self):
+        return ElectionDataParser.parse_results(self.progress, self.metadata)['20241105TX0001']
+
+    def test_unchanged_race_is_reused(self):
+        first = self.parse()
+        self.assertIs(self.parse(), first)
+
+    def test_call_status_change_rebuilds_race(self):
+        # Calls are metadata-only; progress lastUpdated doesn't move
+        first = self.parse()
+        self.metadata = copy.deepcopy(self.metadata)
+        self.metadata['20241105TX0001']['raceCallStatus'] = 'Called'
+        second = self.parse()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.race_call_status, 'Called')
+
+    def test_progress_update_rebuilds_race(self):
+        first = self.parse()
+        self.progress = copy.deepcopy(self.progress)
+        progress = self.progress['20241105TX0001']
+        progress['lastUpdated'] = '2024-11-06T06:00:00+00:00'
+        progress['candidates'][0]['voteCount'] = 700
+        second = self.parse()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.candidates[0].vote_count, 700)
+
+
+class FakeResponse:
+    """The parts of requests.Response the fetch helpers use."""
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def __enter__(self):
+        # Streamed responses are read through .raw
+        self.raw = io.BytesIO(self.content)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+
+class FakeServer:
+    """Session stand-in serving one JSON document with an ETag, honouring If-None-Match."""
+
+    def __init__(self, payload, etag='"v1"'):
+        self.payload = payload
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        if headers.get('If-None-Match') == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.payload, {'ETag': self.etag})
+
+
+class CachedGetTest(unittest.TestCase):
+    """cached_get stores, revalidates and recovers its on-disk copies."""
+
+    URL = 'https://example.test/results/national/metadata.json'
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.server = FakeServer({'race': {'officeName': 'Governor'}})
+
+    def cache_files(self):
+        return sorted(os.listdir(self.cache_dir))
+
+    def corrupt(self, suffix):
+        """Truncate the cached file ending in suffix, as a killed write would."""
+        name = next(name for name in self.cache_files() if name.endswith(suffix))
+        path = os.path.join(self.cache_dir, name)
+        with open(path, 'rb') as f:
+            content = f.read()
+        with open(path, 'wb') as f:
+            f.write(content[:len(content) // 2])
+
+    def test_first_fetch_stores_body_and_validators(self):
+        data = cached_get(self.server, self.URL, self.cache_dir)
+        self.assertEqual(data, self.server.payload)
+        self.assertEqual(self.server.requests, [{}])
+        files = self.cache_files()
+        self.assertEqual(len(files), 2)
+        self.assertFalse(any(name.endswith('.tmp') for name in files))
+
+    def test_not_modified_serves_cached_body(self):
+        cached_get(self.server, self.URL, self.cache_dir)
+        data = cached_get(self.server, self.URL, self.cache_dir)
+        self.assertEqual(data, self.server.payload)
+        self.assertEqual(self.server.requests[-1], {'If-None-Match': '"v1"'})
+
+    def test_truncated_validators_are_a_cache_miss(self):
+        cached_get(self.server, self.URL, self.cache_dir)
+        self.corrupt('.meta.json')
+        data = cached_get(self.server, self.URL, self.cache_dir)
+        self.assertEqual(data, self.server.payload)
+        # Fetched unconditionally, and the validators were rewritten
+        self.assertEqual(self.server.requests[-1], {})
+        cached_get(self.server, self.URL, self.cache_dir)
+        self.assertEqual(self.server.requests[-1], {'If-None-Match': '"v1"'})
+
+    def test_truncated_body_is_fetched_again(self):
+        cached_get(self.server, self.URL, self.cache_dir)
+        name = next(name for name in self.cache_files() if not name.endswith('.meta.json'))
+        self.corrupt(name)
+        data = cached_get(self.server, self.URL, self.cache_dir)
+        self.assertEqual(data, self.server.payload)
+        self.assertEqual(self.server.requests[-2:], [{'If-None-Match': '"v1"'}, {}])
+        self.assertEqual(cached_get(self.server, self.URL, self.cache_dir), self.server.payload)
+
+
+
+def county_payload(unit_id, votes):
+    """Detail entry for one county of a two-candidate race."""
+    return {
+        'statePostal': 'TX',
+        'reportingunitName': f'County {unit_id}',
+        'fipsCode': f'48{unit_id:03d}',
+        'reportingunitID': str(unit_id),
+        'precinctsReporting': 3,
+        'precinctsTotal': 4,
+        'precinctsReportingPct': 75.0,
+        'eevp': 80.0,
+        'lastUpdated': '2024-11-06T05:00:00+00:00',
+        'parameters': {'vote': {'total': sum(votes), 'registered': 5000}},
+        'candidates': [
+            {'candidateID': str(i + 1), 'voteCount': v, 'votePct': round(100 * v / sum(votes), 2)}
+            for i, v in enumerate(votes)
+        ],
+    }
+
+
+DETAIL = {'unit1': county_payload(1, [600, 400]), 'unit2': county_payload(2, [250, 750])}
+
+
+class FakeIjson:
+    """Stand-in for ijson.kvitems over an already buffered stream.
+
+    With fail_after set, the stream breaks after that many counties, the way
+    a dropped connection surfaces as an incomplete-JSON error part way through.
+    """
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+
+    def kvitems(self, stream, prefix, use_float=False):
+        for n, item in enumerate(json.load(stream).items()):
+            if n == self.fail_after:
+                raise ValueError("Incomplete JSON content")
+            yield item
+
+
+class DetailServer:
+    """Session stand-in serving a race's detail.json."""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.timeouts = []
+
+    def get(self, url, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        return FakeResponse(self.status_code, self.payload)
+
+
+class DetailedResultsTest(unittest.TestCase):
+    """get_detailed_results gives every county, or [] when the fetch fails."""
+
+    def results(self, server, ijson_module=None):
+        detailed_parser = DetailedDataParser('https://example.test', session=server)
+        with mock.patch.object(parser, 'ijson', ijson_module), redirect_stdout(io.StringIO()) as out:
+            results = detailed_parser.get_detailed_results('20241105TX0001', 'TX')
+        self.output = out.getvalue()
+        return results
+
+    def test_streamed_results_match_full_decode(self):
+        server = DetailServer(DETAIL)
+        buffered = self.results(server)
+        streamed = self.results(server, FakeIjson())
+        self.assertEqual(len(buffered), 2)
+        self.assertEqual(streamed, buffered)
+        self.assertEqual(server.timeouts, [30, 30])
+
+    def test_stream_cut_short_is_a_failed_fetch(self):
+        results = self.results(DetailServer(DETAIL), FakeIjson(fail_after=1))
+        self.assertEqual(results, [])
+        self.assertIn("Error fetching detailed data for TX/20241105TX0001", self.output)
+
+    def test_http_error_is_a_failed_fetch(self):
+        for ijson_module in (None, FakeIjson()):
+            self.assertEqual(self.results(DetailServer(None, 404), ijson_module), [])
+            self.assertIn("404 error", self.output)
+
+
+
+# Candidate 2 is listed first, and each county lacks one of the three candidates
+MIXED_DETAIL = {
+    'unitA': {'reportingunitID': 'A', 'candidates': [
+        {'candidateID': '2', 'voteCount': 30, 'votePct': 30.0},
+        {'candidateID': '1', 'voteCount': 70, 'votePct': 70.0},
+    ]},
+    'unitB': {'reportingunitID': 'B', 'candidates': [
+        {'candidateID': '1', 'voteCount': 5, 'votePct': 25.0},
+        {'candidateID': '3', 'voteCount': 15, 'votePct': 75.0},
+    ]},
+}
+
+
+class CountyMatrixTest(unittest.TestCase):
+    """parse_race_county_matrix lays counties out as (county x candidate) arrays."""
+
+    def test_layout_and_dtypes(self):
+        county_ids, candidate_ids, votes, pct = DetailedDataParser.parse_race_county_matrix(MIXED_DETAIL)
+        self.assertEqual(county_ids.tolist(), ['A', 'B'])
+        # Columns follow first appearance across counties
+        self.assertEqual(candidate_ids.tolist(), ['2', '1', '3'])
+        # Candidates missing from a county count as 0
+        self.assertEqual(votes.tolist(), [[30, 70, 0], [0, 5, 15]])
+        self.assertEqual(pct.tolist(), [[30.0, 70.0, 0.0], [0.0, 25.0, 75.0]])
+        self.assertEqual(votes.dtype.name, 'int64')
+        self.assertEqual(pct.dtype.name, 'float64')
+
+
+
+class AllCountiesFrameTest(unittest.TestCase):
+    """parse_all_counties flattens a race into one (county, candidate) row each."""
+
+    def test_rows_and_dtypes(self):
+        df = DetailedDataParser.parse_all_counties(MIXED_DETAIL)
+        self.assertEqual(list(df.columns), ['county_id', 'candidate_id', 'votes', 'pct'])
+        self.assertEqual(
+            [tuple(row) for row in df.itertuples(index=False)],
+            [('A', '2', 30, 30.0), ('A', '1', 70, 70.0), ('B', '1', 5, 25.0), ('B', '3', 15, 75.0)]
+        )
+        self.assertEqual(df['votes'].dtype.name, 'int64')
+        self.assertEqual(df['pct'].dtype.name, 'float64')
+
+    def test_pivot_matches_county_matrix(self):
+        df = DetailedDataParser.parse_all_counties(MIXED_DETAIL)
+        _, candidate_ids, votes, _ = DetailedDataParser.parse_race_county_matrix(MIXED_DETAIL)
+        # Candidate columns in first-seen order; missing (county, candidate) pairs become 0
+        wide = df.pivot(index='county_id', columns='candidate_id', values='votes')
+        wide = wide[list(df['candidate_id'].unique())].fillna(0).astype('int64')
+        self.assertEqual(list(wide.columns), candidate_ids.tolist())
+        self.assertEqual(wide.to_numpy().tolist(), votes.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()